@@ -0,0 +1,90 @@
+"""
+Measure how fast the repository of fields resolves and finds fields.
+
+A repository of 1,000 fields, half of them referred to by their readable JIRA
+names like custom fields are, is resolved against a JIRA server's field map,
+and then every field is looked up by each of its names.
+
+    python benchmarks/fields.py --repeat 5
+"""
+import timeit
+from typing import Callable, Dict
+
+import typer
+
+from jirajumper.fields import JiraField, JiraFieldsRepository
+from jirajumper.models import FieldByName
+
+FIELD_COUNT = 1000
+
+
+def generate_fields(field_count: int) -> JiraFieldsRepository:
+    """Make up fields, every other one a read only custom field."""
+    return JiraFieldsRepository(
+        JiraField(
+            jira_name=(
+                FieldByName(f'Custom {number}')
+                if number % 2 else f'field_{number}'
+            ),
+            human_name=f'field-{number}',
+            description=f'Field number {number}.',
+            to_jira=NotImplemented if number % 2 else str,
+            is_mutable=bool(number % 3),
+        )
+        for number in range(field_count)
+    )
+
+
+def main(
+    field_count: int = typer.Option(FIELD_COUNT, help='Fields to resolve.'),
+    repeat: int = typer.Option(5, help='Runs per operation; best is shown.'),
+):
+    """Measure resolution and lookups of fields."""
+    fields = generate_fields(field_count)
+    field_key_by_name = {
+        f'Custom {number}': f'customfield_{number}'
+        for number in range(field_count)
+    }
+    resolved_fields = JiraFieldsRepository(
+        field.resolve(field_key_by_name=field_key_by_name)
+        for field in fields
+    )
+    options: Dict[str, str] = {
+        field.human_name: 'value'
+        for field in resolved_fields[::10]
+    }
+
+    operations: Dict[str, Callable[[], object]] = {
+        'resolve': lambda: JiraFieldsRepository(
+            field.resolve(field_key_by_name=field_key_by_name)
+            for field in fields
+        ),
+        'find_by_human_name': lambda: [
+            resolved_fields.find_by_human_name(field.human_name)
+            for field in resolved_fields
+        ],
+        'find_by_jira_name': lambda: [
+            resolved_fields.find_by_jira_name(field.jira_name)
+            for field in resolved_fields
+        ],
+        'find_by_unresolved_jira_name': lambda: [
+            resolved_fields.find_by_unresolved_jira_name(
+                field.unresolved_jira_name,
+            )
+            for field in resolved_fields
+        ],
+        'match_options': lambda: resolved_fields.match_options(options),
+        # Views are computed once per repository, so a fresh one is needed.
+        'writable, mutable': lambda: (
+            JiraFieldsRepository(resolved_fields).writable(),
+            JiraFieldsRepository(resolved_fields).mutable(),
+        ),
+    }
+
+    for operation_name, operation in operations.items():
+        best_ms = min(timeit.repeat(operation, number=1, repeat=repeat)) * 1000
+        typer.echo(f'{operation_name:<30} {best_ms:8.3f} ms')
+
+
+if __name__ == '__main__':
+    typer.run(main)
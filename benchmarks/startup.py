@@ -0,0 +1,137 @@
+"""
+Measure cold start of every `jj` subcommand.
+
+Each subcommand is run as `jj <subcommand> --help` in a fresh interpreter
+with `python -X importtime`, which makes it import everything the subcommand
+depends on but sends no requests to JIRA. For every subcommand, the script
+prints wall time, time spent on imports and the packages which took longest
+to import.
+
+    python benchmarks/startup.py --repeat 5 --max-import-ms 400
+
+With `--max-import-ms`, exit with an error if any subcommand imports for
+longer than that, which is useful to catch an accidental heavy import.
+"""
+import os
+import re
+import subprocess  # noqa: S404
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import typer
+
+from jirajumper.cli import LAZY_COMMANDS
+
+IMPORT_TIME_LINE = re.compile(
+    r'^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| '
+    r'(?P<indent>\s*)(?P<module>\S+)$',
+)
+
+# Number of the heaviest packages to print per subcommand.
+HEAVIEST_COUNT = 3
+
+
+class StartupTime(NamedTuple):
+    """Cold start measurements of one subcommand, in milliseconds."""
+
+    wall_ms: float
+    import_ms: float
+    heaviest: List[Tuple[str, float]]
+
+
+def parse_import_time(stderr: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Sum up import time, and find the packages which took longest.
+
+    Time of a package is that of all its modules, excluding their own imports
+    of other packages.
+    """
+    import_ms = 0.0
+    ms_by_package: Dict[str, float] = defaultdict(float)
+
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+
+        package = match.group('module').split('.')[0]
+        ms_by_package[package] += int(match.group('self')) / 1000
+
+        if not match.group('indent'):
+            import_ms += int(match.group('cumulative')) / 1000
+
+    heaviest = sorted(
+        ms_by_package.items(),
+        key=lambda package_ms: package_ms[1],
+        reverse=True,
+    )
+    return import_ms, heaviest[:HEAVIEST_COUNT]
+
+
+def measure(subcommand: str) -> StartupTime:
+    """Run the subcommand once in a fresh interpreter."""
+    started_at = time.perf_counter()
+    completed = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            '-X',
+            'importtime',
+            '-m',
+            'jirajumper',
+            subcommand,
+            '--help',
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, 'JIRAJUMPER_NO_DAEMON': '1'},
+    )
+    wall_ms = (time.perf_counter() - started_at) * 1000
+
+    import_ms, heaviest = parse_import_time(completed.stderr)
+    return StartupTime(
+        wall_ms=wall_ms,
+        import_ms=import_ms,
+        heaviest=heaviest,
+    )
+
+
+def main(
+    repeat: int = typer.Option(3, help='Runs per subcommand; best is shown.'),
+    max_import_ms: Optional[float] = typer.Option(
+        None,
+        help='Fail if any subcommand spends longer on imports.',
+    ),
+):
+    """Measure cold start of every `jj` subcommand."""
+    slow_subcommands = []
+
+    for subcommand in sorted(LAZY_COMMANDS):
+        startup_time = min(
+            (measure(subcommand) for _run in range(repeat)),
+            key=lambda measurement: measurement.wall_ms,
+        )
+
+        heaviest = ', '.join(
+            f'{package} {package_ms:.0f}'
+            for package, package_ms in startup_time.heaviest
+        )
+        typer.echo(
+            f'{subcommand:<8} wall {startup_time.wall_ms:6.0f} ms   '
+            f'imports {startup_time.import_ms:6.0f} ms   ({heaviest})',
+        )
+
+        if max_import_ms is not None and (
+            startup_time.import_ms > max_import_ms
+        ):
+            slow_subcommands.append(subcommand)
+
+    if slow_subcommands:
+        typer.echo(f'Too slow to start: {", ".join(slow_subcommands)}')
+        raise typer.Exit(1)
+
+
+if __name__ == '__main__':
+    typer.run(main)
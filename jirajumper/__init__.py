@@ -1 +1,12 @@
-from jirajumper.cli import app
+def __getattr__(name: str):
+    """
+    Import the Typer app on first access.
+
+    `jirajumper.entrypoint`, which is imported on every `jj` call, should not
+    pay for importing it.
+    """
+    if name == 'app':
+        from jirajumper.cli import app  # noqa: WPS433
+        return app
+
+    raise AttributeError(name)
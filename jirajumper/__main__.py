@@ -0,0 +1,3 @@
+from jirajumper.entrypoint import main
+
+main()
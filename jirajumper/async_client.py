@@ -0,0 +1,107 @@
+"""
+Asyncio interface to JIRA REST API, for commands touching many issues.
+
+`jira.JIRA` is synchronous, and no asynchronous HTTP client is among our
+dependencies. Instead, requests are sent by the session of the regular client
+(which has the credentials and the keep-alive connection pool) in a pool of
+threads, and `asyncio` is used to schedule, bound and cancel them.
+"""
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from jira import JIRA
+
+ResultType = TypeVar('ResultType')
+JSONResponse = Optional[Dict[str, Any]]
+
+
+@dataclass
+class AsyncJira:
+    """
+    Send JIRA API requests concurrently, at most `concurrency` at a time.
+
+    Use as an async context manager. Requests waiting for their turn are
+    cancelled with the task awaiting them; requests already sent are allowed
+    to complete.
+    """
+
+    client: JIRA
+    concurrency: int = 4
+
+    _executor: Optional[ThreadPoolExecutor] = field(default=None, init=False)
+    _semaphore: Optional[asyncio.Semaphore] = field(default=None, init=False)
+
+    async def __aenter__(self) -> 'AsyncJira':
+        """Start the pool of worker threads."""
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        # Created here to belong to the running event loop.
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stop the pool without waiting for requests in flight."""
+        self._executor.shutdown(wait=False)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> JSONResponse:
+        """
+        Send a request to the API path, like `issue/PROJ-123`.
+
+        Raises `JIRAError` on error responses, like the regular client. The
+        session of the client already retries requests throttled by JIRA.
+        """
+        send = getattr(self.client._session, method.lower())  # noqa: WPS437
+        url = self.client._get_url(path)  # noqa: WPS437
+
+        request_kwargs: Dict[str, Any] = {'params': params}
+        if body is not None:
+            request_kwargs['data'] = json.dumps(body)
+
+        async with self._semaphore:
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                partial(send, url, **request_kwargs),
+            )
+
+        if not response.content:
+            return None
+
+        return response.json()
+
+    async def get(self, path: str, **params: Any) -> JSONResponse:
+        """Send a GET request."""
+        return await self.request('GET', path, params=params)
+
+    async def post(self, path: str, body: Dict[str, Any]) -> JSONResponse:
+        """Send a POST request."""
+        return await self.request('POST', path, body=body)
+
+    async def put(self, path: str, body: Dict[str, Any]) -> JSONResponse:
+        """Send a PUT request."""
+        return await self.request('PUT', path, body=body)
+
+    async def delete(self, path: str) -> JSONResponse:
+        """Send a DELETE request."""
+        return await self.request('DELETE', path)
+
+
+def run_async(
+    client: JIRA,
+    concurrency: int,
+    operation: Callable[[AsyncJira], Awaitable[ResultType]],
+) -> ResultType:
+    """Run an asynchronous operation from synchronous code, and wait for it."""
+    async def run() -> ResultType:  # noqa: WPS430
+        async with AsyncJira(client=client, concurrency=concurrency) as jira:
+            return await operation(jira)
+
+    return asyncio.run(run())
@@ -1,17 +1,45 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from functools import cached_property
 from logging import Logger
 from pathlib import Path
-from typing import Optional
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from jira import JIRA, Issue
 from pydantic import BaseModel, Field
 from typer import Context
 
-from jirajumper.fields import JiraFieldsRepository
+from jirajumper.cache.completion import CompletionIndex, completion_index_path
+from jirajumper.cache.issues import IssueResponseCache
+from jirajumper.cache.mirror import IssueMirror
+from jirajumper.cache.server import ServerCache
+from jirajumper.cache.users import (
+    DirectoryUser,
+    UserDirectory,
+    UserNotFound,
+    fetch_user_directory,
+)
+from jirajumper.cache.workflows import WorkflowCache
+from jirajumper.client import env_server, jira
+from jirajumper.entrypoint import daemon_socket_path
+from jirajumper.fields import FIELDS, JiraFieldsRepository
 from jirajumper.fields.field import FieldKeyByName
 from jirajumper.models import OutputFormat
 
+CachedModel = TypeVar('CachedModel', bound=BaseModel)
+
+# A user directory this young is not downloaded again to find a missing user.
+USER_DIRECTORY_MIN_AGE = timedelta(minutes=5)
+
 
 class IssueFieldSchema(BaseModel):
     """JIRA issue field schema."""
@@ -20,23 +48,160 @@ class IssueFieldSchema(BaseModel):
     system: Optional[str] = None
 
 
+class IssueFieldMetadata(BaseModel):
+    """JIRA issue field description, as returned by `/rest/api/2/field`."""
+
+    key: str
+    name: str
+    clause_names: List[str] = Field(default_factory=list, alias='clauseNames')
+    field_schema: Optional[IssueFieldSchema] = Field(None, alias='schema')
+
+
+class FieldMetadataCache(ServerCache):
+    """Issue field metadata and deployment info of a particular JIRA server."""
+
+    issue_fields: List[IssueFieldMetadata]
+
+    deployment_type: Optional[str] = None
+    version_numbers: Tuple[int, ...] = ()
+
+    @property
+    def key_by_name(self) -> FieldKeyByName:
+        """
+        Map field names to keys.
+
+        This is useful for `custom*` and the like: the field key can vary
+        among installations but the canonical name helps us to find that key.
+        """
+        return {
+            issue_field.name: issue_field.key
+            for issue_field in self.issue_fields
+        }
+
+    @property
+    def key_by_clause_name(self) -> Dict[str, str]:
+        """Map JQL clause names to field keys."""
+        return {
+            clause_name: issue_field.key
+            for issue_field in self.issue_fields
+            for clause_name in issue_field.clause_names
+        }
+
+
+class IssueLinkTypeMetadata(BaseModel):
+    """JIRA issue link type, as returned by `/rest/api/2/issueLinkType`."""
+
+    name: str
+    inward: str
+    outward: str
+
+
+class ResolvedLinkType(NamedTuple):
+    """Direction of an issue link type, as chosen by the user."""
+
+    name: str
+    description: str
+    is_inward: bool
+
+
+def link_type_slug(description: str) -> str:
+    """Convert link description, like `is blocked by`, to a CLI choice."""
+    return '-'.join(description.lower().split())
+
+
+class LinkTypesCache(ServerCache):
+    """Issue link types of a particular JIRA server."""
+
+    link_types: List[IssueLinkTypeMetadata]
+
+    @property
+    def by_slug(self) -> Dict[str, ResolvedLinkType]:
+        """
+        Map CLI choices, like `blocks` or `is-blocked-by`, to link types.
+
+        If both directions are described alike, like `relates to`, the outward
+        one is used.
+        """
+        inward_types = {
+            link_type_slug(link_type.inward): ResolvedLinkType(
+                name=link_type.name,
+                description=link_type.inward,
+                is_inward=True,
+            )
+            for link_type in self.link_types
+        }
+
+        outward_types = {
+            link_type_slug(link_type.outward): ResolvedLinkType(
+                name=link_type.name,
+                description=link_type.outward,
+                is_inward=False,
+            )
+            for link_type in self.link_types
+        }
+
+        return {**inward_types, **outward_types}
+
+
 class JiraCache(BaseModel):
     """Cached JIRA configuration."""
 
     selected_issue_key: Optional[str] = None
 
 
-def field_key_by_name(jira: JIRA) -> FieldKeyByName:
-    """
-    Map field names to keys.
+def read_cache_file(
+    path: Path,
+    model: Type[CachedModel],
+) -> Optional[CachedModel]:
+    """Read a cached model from disk; ignore missing or broken files."""
+    try:
+        raw_cache = path.read_text()
+    except (FileNotFoundError, PermissionError):
+        return None
+
+    try:
+        return model.parse_raw(raw_cache)
+    except ValueError:
+        return None
+
+
+def write_cache_file(path: Path, cached_model: BaseModel) -> None:
+    """Store a cached model on disk."""
+    encoded_cache = cached_model.json(by_alias=True)
+
+    try:
+        path.write_text(encoded_cache)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(encoded_cache)
+
+
+def fetch_field_metadata(client: JIRA) -> FieldMetadataCache:
+    """Download issue field metadata and server info from JIRA."""
+    server_info = client.server_info()
+
+    return FieldMetadataCache(
+        server=client.server_url,
+        retrieved_at=datetime.now(tz=timezone.utc),
+        issue_fields=[
+            IssueFieldMetadata.parse_obj(raw_field)
+            for raw_field in client.fields()
+        ],
+        deployment_type=server_info.get('deploymentType'),
+        version_numbers=server_info['versionNumbers'],
+    )
 
-    This is useful for `custom*` and the like: the field key can vary
-    among installations but the canonical name helps us to find that key.
-    """
-    return {
-        field['name']: field['key']
-        for field in jira.fields()
-    }
+
+def fetch_link_types(client: JIRA) -> LinkTypesCache:
+    """Download issue link types from JIRA."""
+    return LinkTypesCache(
+        server=client.server_url,
+        retrieved_at=datetime.now(tz=timezone.utc),
+        link_types=[
+            IssueLinkTypeMetadata.parse_obj(link_type.raw)
+            for link_type in client.issue_link_types()
+        ],
+    )
 
 
 @dataclass
@@ -45,50 +210,305 @@ class GlobalOptions:
 
     logger: Logger
     output_format: OutputFormat
-    jira: JIRA
     cache_path: Path
-    fields: JiraFieldsRepository
+    cache_ttl: timedelta
+    use_mirror: bool = True
 
     @cached_property
     def cache(self) -> JiraCache:
         """Retrieve jirajumper cache from disk."""
-        try:
-            raw_cache = self.cache_path.read_text()
-        except (FileNotFoundError, PermissionError):
-            return JiraCache()
-
-        try:
-            return JiraCache.parse_raw(raw_cache)
-        except ValueError:
-            return JiraCache()
+        return read_cache_file(self.cache_path, JiraCache) or JiraCache()
 
     def store_cache(self, cache: JiraCache):
         """Store cache contents on disk."""
-        encoded_cache = cache.json(by_alias=True)
+        write_cache_file(self.cache_path, cache)
+
+    @property
+    def field_metadata_path(self) -> Path:
+        """Path to the file with cached issue field metadata."""
+        return self.cache_path.with_name('fields.json')
+
+    @property
+    def renders_path(self) -> Path:
+        """Directory where rendered graphs are cached."""
+        return self.cache_path.with_name('renders')
+
+    @property
+    def mirror_path(self) -> Path:
+        """Path to the local issue mirror database."""
+        return self.cache_path.with_name('issues.sqlite3')
+
+    @property
+    def daemon_socket_path(self) -> Path:
+        """Path to the Unix socket `jj daemon` listens on."""
+        return daemon_socket_path(self.cache_path)
 
+    @property
+    def workflows_path(self) -> Path:
+        """Path to the file with JIRA workflows learned so far."""
+        return self.cache_path.with_name('workflows.json')
+
+    @cached_property
+    def workflow_cache(self) -> WorkflowCache:
+        """Workflows learned so far, if they belong to the current server."""
+        workflow_cache = read_cache_file(self.workflows_path, WorkflowCache)
+
+        if workflow_cache is None or workflow_cache.server != self.server:
+            return WorkflowCache(server=self.server)
+
+        return workflow_cache
+
+    def store_workflow_cache(self) -> None:
+        """Store learned workflows on disk."""
+        write_cache_file(self.workflows_path, self.workflow_cache)
+
+    @cached_property
+    def mirror(self) -> Optional[IssueMirror]:
+        """Local issue mirror, if it has been synced and may be used."""
+        issue_mirror = IssueMirror(path=self.mirror_path)
+
+        if self.use_mirror and issue_mirror.exists():
+            return issue_mirror
+
+        return None
+
+    @property
+    def server(self) -> str:
+        """JIRA server URL, as configured; no connection is made."""
+        return (env_server() or '').rstrip('/')
+
+    def refresh_field_metadata(self) -> FieldMetadataCache:
+        """Download issue field metadata from JIRA and store it on disk."""
+        # Not `self.jira`: it is configured from the metadata we are fetching.
+        field_metadata = fetch_field_metadata(jira())
+        write_cache_file(self.field_metadata_path, field_metadata)
+        return field_metadata
+
+    @cached_property
+    def field_metadata(self) -> FieldMetadataCache:
+        """Issue field metadata, from disk if fresh enough."""
+        field_metadata = read_cache_file(
+            self.field_metadata_path,
+            FieldMetadataCache,
+        )
+
+        is_fresh = field_metadata and field_metadata.is_fresh(
+            server=self.server,
+            ttl=self.cache_ttl,
+        )
+        if not is_fresh:
+            self.logger.info('Field metadata is stale, refreshing.')
+            field_metadata = self.refresh_field_metadata()
+
+        return field_metadata
+
+    @property
+    def link_types_path(self) -> Path:
+        """Path to the file with cached issue link types."""
+        return self.cache_path.with_name('link_types.json')
+
+    def refresh_link_types(self) -> LinkTypesCache:
+        """Download issue link types from JIRA and store them on disk."""
+        link_types = fetch_link_types(self.jira)
+        write_cache_file(self.link_types_path, link_types)
+        return link_types
+
+    @cached_property
+    def link_types(self) -> LinkTypesCache:
+        """Issue link types, from disk if fresh enough."""
+        link_types = read_cache_file(self.link_types_path, LinkTypesCache)
+
+        is_fresh = link_types and link_types.is_fresh(
+            server=self.server,
+            ttl=self.cache_ttl,
+        )
+        if not is_fresh:
+            self.logger.info('Issue link types are stale, refreshing.')
+            link_types = self.refresh_link_types()
+
+        return link_types
+
+    @property
+    def users_path(self) -> Path:
+        """Path to the file with cached JIRA users."""
+        return self.cache_path.with_name('users.json')
+
+    def refresh_user_directory(self) -> UserDirectory:
+        """Download JIRA users and store them on disk."""
+        user_directory = fetch_user_directory(self.jira)
+        write_cache_file(self.users_path, user_directory)
+        return user_directory
+
+    @cached_property
+    def user_directory(self) -> UserDirectory:
+        """JIRA users, from disk if fresh enough."""
+        user_directory = read_cache_file(self.users_path, UserDirectory)
+
+        is_fresh = user_directory and user_directory.is_fresh(
+            server=self.server,
+            ttl=self.cache_ttl,
+        )
+        if not is_fresh:
+            self.logger.info('User directory is stale, refreshing.')
+            user_directory = self.refresh_user_directory()
+
+        return user_directory
+
+    def find_user(self, query: str) -> DirectoryUser:
+        """
+        Find a user by display name or email, tolerating typos.
+
+        If nobody matches, the user might have joined JIRA after the directory
+        was downloaded; it is downloaded again unless it is brand new.
+        """
         try:
-            self.cache_path.write_text(encoded_cache)
-        except FileNotFoundError:
-            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            self.cache_path.write_text(encoded_cache)
+            return self.user_directory.find(query)
+        except UserNotFound:
+            if self.user_directory.is_fresh(
+                server=self.server,
+                ttl=USER_DIRECTORY_MIN_AGE,
+            ):
+                raise
+
+        self.user_directory = self.refresh_user_directory()
+        return self.user_directory.find(query)
+
+    @cached_property
+    def jira(self) -> JIRA:
+        """
+        JIRA client, constructed on first use.
+
+        Server info and field names, which the client would otherwise request
+        on its own, are restored from cached metadata.
+        """
+        client = jira()
+        field_metadata = self.field_metadata
+
+        client.deploymentType = field_metadata.deployment_type
+        client._version = field_metadata.version_numbers  # noqa: WPS437
+
+        # `JIRA.search_issues()` would otherwise download `/field` to
+        # translate JQL names of requested fields.
+        client._fields_cache_value = (  # noqa: WPS437
+            field_metadata.key_by_clause_name
+        )
+
+        return client
+
+    @cached_property
+    def fields(self) -> JiraFieldsRepository:
+        """Supported fields with JIRA names resolved for this server."""
+        # Computed once: it maps every field of the server.
+        field_key_by_name = self.field_key_by_name
+
+        return JiraFieldsRepository(
+            jira_field.resolve(field_key_by_name=field_key_by_name)
+            for jira_field in FIELDS
+        )
+
+    @property
+    def issue_responses_path(self) -> Path:
+        """Directory where downloaded issues are cached."""
+        return self.cache_path.with_name('issue_responses')
+
+    def issue(self, issue_key: str, fresh: bool = False) -> Issue:
+        """
+        Retrieve an issue, downloading it only if it has changed.
+
+        With `fresh`, download it in any case.
+        """
+        issue_cache = IssueResponseCache(
+            path=self.issue_responses_path,
+            server=self.server,
+        )
+        raw_issue = issue_cache.fetch(
+            client=self.jira,
+            issue_key=issue_key,
+            fresh=fresh,
+        )
+
+        issue = Issue(
+            options=self.jira._options,  # noqa: WPS437
+            session=self.jira._session,  # noqa: WPS437
+            raw=raw_issue,
+        )
+        self.index_for_completion([issue])
+        return issue
+
+    @property
+    def completion_index_path(self) -> Path:
+        """Path to the file with issue keys and values for shell completion."""
+        return completion_index_path(self.cache_path)
+
+    def index_for_completion(self, issues: Iterable[Issue]) -> None:
+        """Remember issue keys and field values to offer them in completion."""
+        completion_index = read_cache_file(
+            self.completion_index_path,
+            CompletionIndex,
+        ) or CompletionIndex()
+
+        updated_index = completion_index.copy(deep=True)
+        updated_index.remember_issues(issues, fields=self.fields)
+
+        if updated_index != completion_index:
+            write_cache_file(self.completion_index_path, updated_index)
 
     @cached_property
     def current_issue(self) -> Issue:
         """Construct the currently selected JIRA issue object."""
-        return self.jira.issue(self.cache.selected_issue_key)
+        return self.issue(self.cache.selected_issue_key)
 
-    @cached_property
+    @property
     def field_key_by_name(self) -> FieldKeyByName:
+        """Map field names to keys."""
+        return self.field_metadata.key_by_name
+
+    def forget_command_state(self) -> None:
         """
-        Map field names to keys.
+        Drop whatever another process might have changed since last command.
 
-        This is useful for `custom*` and the like: the field key can vary
-        among installations but the canonical name helps us to find that key.
+        The JIRA client, field metadata and fields are kept while the metadata
+        is fresh; the rest is cheap to read from disk again.
         """
-        return {
-            field['name']: field['key']
-            for field in self.jira.fields()
-        }
+        for name in ('cache', 'current_issue', 'mirror', 'workflow_cache'):
+            self.__dict__.pop(name, None)
+
+        field_metadata = self.__dict__.get('field_metadata')
+        is_fresh = field_metadata and field_metadata.is_fresh(
+            server=self.server,
+            ttl=self.cache_ttl,
+        )
+        if not is_fresh:
+            for name in (  # noqa: WPS352
+                'field_metadata',
+                'jira',
+                'fields',
+                'link_types',
+                'user_directory',
+            ):
+                self.__dict__.pop(name, None)
+
+
+@dataclass
+class WarmOptions:
+    """GlobalOptions kept by `jj daemon` between commands it serves."""
+
+    options_by_key: Dict[Tuple[Path, timedelta, bool], GlobalOptions] = field(
+        default_factory=dict,
+    )
+
+    def reuse(self, options: GlobalOptions) -> GlobalOptions:
+        """Find warm options configured alike, or keep these for later."""
+        warm_options = self.options_by_key.setdefault(
+            (options.cache_path, options.cache_ttl, options.use_mirror),
+            options,
+        )
+
+        warm_options.logger = options.logger
+        warm_options.output_format = options.output_format
+        warm_options.forget_command_state()
+
+        return warm_options
 
 
 class JeevesJiraContext(Context):
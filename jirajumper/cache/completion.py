@@ -0,0 +1,132 @@
+"""
+Shell completion of issue keys and field values.
+
+Completion must answer before the user notices, so it never contacts JIRA:
+values are offered from an index of issues which `jj` commands have recently
+seen, stored in the cache directory.
+"""
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List
+
+import click
+from jira import Issue
+from pydantic import BaseModel, Field
+
+from jirajumper.entrypoint import env_cache_path
+from jirajumper.fields import JiraField, JiraFieldsRepository
+
+# Fields worth completing: they have a limited set of values.
+INDEXED_FIELDS = ('version', 'epic', 'type', 'status', 'assignee', 'project')
+
+MAX_ISSUE_KEYS = 200
+MAX_FIELD_VALUES = 100
+
+FieldCompletion = Callable[[click.Context, List[str], str], List[str]]
+
+
+def most_recent_first(
+    known_values: List[str],
+    seen_values: Iterable[str],
+    limit: int,
+) -> List[str]:
+    """Move values just seen to the front, forgetting the oldest ones."""
+    recent_values = list(dict.fromkeys(seen_values))
+    return [
+        *recent_values,
+        *(
+            known_value
+            for known_value in known_values
+            if known_value not in recent_values
+        ),
+    ][:limit]
+
+
+def starting_with(values: Iterable[str], incomplete: str) -> List[str]:
+    """Choose values that the user might be typing."""
+    prefix = incomplete.lower()
+    return [
+        completed_value
+        for completed_value in values
+        if completed_value.lower().startswith(prefix)
+    ]
+
+
+class CompletionIndex(BaseModel):
+    """Issue keys and field values offered by shell completion."""
+
+    issue_keys: List[str] = Field(default_factory=list)
+    values_by_field: Dict[str, List[str]] = Field(default_factory=dict)
+
+    def remember_issues(
+        self,
+        issues: Iterable[Issue],
+        fields: JiraFieldsRepository,
+    ) -> None:
+        """Remember keys and field values of issues."""
+        issues = list(issues)
+
+        self.issue_keys = most_recent_first(
+            self.issue_keys,
+            [issue.key for issue in issues],
+            limit=MAX_ISSUE_KEYS,
+        )
+
+        for human_name in INDEXED_FIELDS:
+            indexed_field = fields.find_by_human_name(human_name)
+            if indexed_field is None:
+                continue
+
+            human_values = (
+                retrieve_if_present(indexed_field, issue)
+                for issue in issues
+            )
+            self.values_by_field[human_name] = most_recent_first(
+                self.values_by_field.get(human_name, []),
+                map(str, filter(None, human_values)),
+                limit=MAX_FIELD_VALUES,
+            )
+
+
+def retrieve_if_present(indexed_field: JiraField, issue: Issue):
+    """Retrieve a field value, unless the field was not downloaded."""
+    try:
+        return indexed_field.retrieve(issue)
+    except AttributeError:
+        return None
+
+
+def completion_index_path(cache_path: Path) -> Path:
+    """Path to the completion index next to jirajumper cache."""
+    return cache_path.with_name('completion.json')
+
+
+def read_completion_index(ctx: click.Context) -> CompletionIndex:
+    """Read the index of the cache `jj` is being invoked with."""
+    cache_path = ctx.find_root().params.get('cache_path') or env_cache_path()
+    try:
+        return CompletionIndex.parse_file(
+            completion_index_path(Path(cache_path)),
+        )
+    except (OSError, ValueError):
+        return CompletionIndex()
+
+
+def complete_issue_key(ctx: click.Context, incomplete: str) -> List[str]:
+    """Offer issue keys seen recently."""
+    return starting_with(read_completion_index(ctx).issue_keys, incomplete)
+
+
+def field_completion(human_name: str) -> FieldCompletion:
+    """Offer values of a field seen recently."""
+    def complete_field(  # noqa: WPS430
+        ctx: click.Context,
+        args: List[str],
+        incomplete: str,
+    ) -> List[str]:
+        index = read_completion_index(ctx)
+        return starting_with(
+            index.values_by_field.get(human_name, []),
+            incomplete,
+        )
+
+    return complete_field
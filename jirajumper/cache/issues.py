@@ -0,0 +1,121 @@
+import os
+import re
+from dataclasses import dataclass
+from http import HTTPStatus
+from pathlib import Path
+from typing import Optional
+
+from jira import JIRA, JIRAError
+from pydantic import BaseModel
+
+from jirajumper.cache.mirror import RawIssue
+
+
+class CachedIssueResponse(BaseModel):
+    """Issue as last received from JIRA, with data to revalidate it."""
+
+    raw: RawIssue
+    etag: Optional[str] = None
+    updated: Optional[str] = None
+
+
+@dataclass
+class IssueResponseCache:
+    """
+    Issues downloaded from JIRA, one JSON file per issue.
+
+    Cached issues are revalidated on every use: by ETag if JIRA sends one, or
+    else by the `updated` field, which is much cheaper to download than the
+    whole issue. Issues of every JIRA server are stored separately.
+    """
+
+    path: Path
+    server: str
+
+    @property
+    def server_path(self) -> Path:
+        """Directory for issues of the JIRA server."""
+        return self.path / re.sub(r'[^\w.-]+', '_', self.server)
+
+    def entry_path(self, issue_key: str) -> Path:
+        """Path to the cached copy of an issue."""
+        return self.server_path / f'{issue_key.upper()}.json'
+
+    def read(self, issue_key: str) -> Optional[CachedIssueResponse]:
+        """Read an issue from disk; ignore missing or broken files."""
+        try:
+            return CachedIssueResponse.parse_file(self.entry_path(issue_key))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def write(self, issue_key: str, response: CachedIssueResponse) -> None:
+        """Store an issue on disk."""
+        entry_path = self.entry_path(issue_key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Several `jj` processes may be writing the same issue.
+        partial_path = entry_path.with_suffix(f'.{os.getpid()}.partial')
+        partial_path.write_text(response.json())
+        partial_path.replace(entry_path)
+
+    def is_unchanged(
+        self,
+        client: JIRA,
+        issue_key: str,
+        cached: CachedIssueResponse,
+    ) -> bool:
+        """Compare `updated` of the cached issue with that on JIRA."""
+        response = client._session.get(  # noqa: WPS437
+            client._get_url(f'issue/{issue_key}'),  # noqa: WPS437
+            params={'fields': 'updated'},
+        )
+        return response.json()['fields'].get('updated') == cached.updated
+
+    def fetch(
+        self,
+        client: JIRA,
+        issue_key: str,
+        fresh: bool = False,
+    ) -> RawIssue:
+        """
+        Download an issue, unless the cached copy is still current.
+
+        With `fresh`, download it anyway: changes of linked issues, like their
+        statuses, are embedded in the issue but do not change its `updated`.
+        """
+        cached = None if fresh else self.read(issue_key)
+        headers = {}
+
+        if cached is not None and cached.etag:
+            headers['If-None-Match'] = cached.etag
+
+        elif cached is not None and cached.updated:
+            if self.is_unchanged(client, issue_key, cached):
+                return cached.raw
+
+        try:
+            response = client._session.get(  # noqa: WPS437
+                client._get_url(f'issue/{issue_key}'),  # noqa: WPS437
+                headers=headers,
+            )
+        except JIRAError as err:
+            # Some versions of `jira` treat 304 as an error, some do not.
+            if err.status_code == HTTPStatus.NOT_MODIFIED and cached:
+                return cached.raw
+
+            raise
+
+        if response.status_code == HTTPStatus.NOT_MODIFIED and cached:
+            return cached.raw
+
+        raw_issue = response.json()
+        self.write(
+            issue_key,
+            CachedIssueResponse(
+                raw=raw_issue,
+                etag=response.headers.get('ETag'),
+                updated=raw_issue['fields'].get('updated'),
+            ),
+        )
+
+        return raw_issue
@@ -0,0 +1,125 @@
+import json
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+RawIssue = Dict[str, Any]
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS issue (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    updated TEXT,
+    raw TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS issue_project ON issue (project);
+
+CREATE TABLE IF NOT EXISTS sync (
+    project TEXT PRIMARY KEY,
+    last_sync TEXT NOT NULL
+);
+'''
+
+
+@dataclass
+class IssueMirror:
+    """
+    Local copy of JIRA issues of a few projects, in a SQLite database.
+
+    Issues are stored as raw JSON received from JIRA; `jj sync` keeps them
+    current.
+    """
+
+    path: Path
+
+    def exists(self) -> bool:
+        """Find out if the mirror has ever been synced."""
+        return self.path.exists()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema if necessary."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(str(self.path))
+        connection.executescript(SCHEMA)
+        return connection
+
+    def store(self, raw_issues: Iterable[RawIssue]) -> int:
+        """Insert or replace issues; return the number of issues stored."""
+        rows = [
+            (
+                raw_issue['key'],
+                raw_issue['key'].split('-')[0],
+                raw_issue['fields'].get('updated'),
+                json.dumps(raw_issue),
+            )
+            for raw_issue in raw_issues
+        ]
+
+        with closing(self.connect()) as connection, connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO issue VALUES (?, ?, ?, ?)',
+                rows,
+            )
+
+        return len(rows)
+
+    def last_sync(self, project: str) -> Optional[datetime]:
+        """When was the project synced last time."""
+        with closing(self.connect()) as connection:
+            row = connection.execute(
+                'SELECT last_sync FROM sync WHERE project = ?',
+                (project,),
+            ).fetchone()
+
+        return row and datetime.fromisoformat(row[0])
+
+    def mark_synced(self, project: str, synced_at: datetime) -> None:
+        """Remember that the project is synced up to given moment."""
+        with closing(self.connect()) as connection, connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO sync VALUES (?, ?)',
+                (project, synced_at.isoformat()),
+            )
+
+    def projects(self) -> List[str]:
+        """Keys of the projects that were synced at least once."""
+        with closing(self.connect()) as connection:
+            rows = connection.execute(
+                'SELECT project FROM sync ORDER BY project',
+            ).fetchall()
+
+        return [project for (project,) in rows]
+
+    def raw_issue(self, key: str) -> Optional[RawIssue]:
+        """Find an issue by key."""
+        with closing(self.connect()) as connection:
+            row = connection.execute(
+                'SELECT raw FROM issue WHERE key = ?',
+                (key,),
+            ).fetchone()
+
+        return row and json.loads(row[0])
+
+    def raw_issues(
+        self,
+        projects: Optional[List[str]] = None,
+    ) -> Iterator[RawIssue]:
+        """Iterate over mirrored issues, most recently updated first."""
+        query = 'SELECT raw FROM issue'
+        if projects is not None:
+            placeholders = ', '.join('?' for _project in projects)
+            query = f'{query} WHERE project IN ({placeholders})'
+
+        with closing(self.connect()) as connection:
+            rows = connection.execute(
+                f'{query} ORDER BY updated DESC',
+                projects or [],
+            )
+
+            for (raw,) in rows:
+                yield json.loads(raw)
@@ -0,0 +1,79 @@
+import hashlib
+import os
+import time
+from contextlib import suppress
+from datetime import timedelta
+from enum import Enum
+from pathlib import Path
+
+import graphviz
+
+# Rendered graphs not used for this long are deleted.
+RENDER_TTL = timedelta(days=7)
+
+
+class GraphFormat(str, Enum):  # noqa: WPS600
+    """Graph output format."""
+
+    SVG = 'svg'
+    PNG = 'png'
+    DOT = 'dot'
+    JSON = 'json'
+
+
+def render_digest(digraph: graphviz.Digraph, graph_format: GraphFormat) -> str:
+    """Hash everything the rendered graph depends upon."""
+    fingerprint = '\n'.join([
+        digraph.engine,
+        graph_format.value,
+        digraph.source,
+    ])
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def prune_renders(renders_path: Path) -> None:
+    """Delete rendered graphs which have not been used for a while."""
+    expired_at = time.time() - RENDER_TTL.total_seconds()
+
+    for render_path in renders_path.iterdir():
+        # Another process might be pruning the same directory.
+        with suppress(FileNotFoundError):
+            if render_path.stat().st_mtime < expired_at:
+                render_path.unlink()
+
+
+def cached_render(
+    digraph: graphviz.Digraph,
+    graph_format: GraphFormat,
+    renders_path: Path,
+) -> Path:
+    """
+    Render the graph, unless an identical one has been rendered before.
+
+    Rendered files are named after the hash of their DOT source. The `dot`
+    format is the DOT source itself, and does not need Graphviz to render.
+    """
+    render_path = renders_path / '{digest}.{extension}'.format(
+        digest=render_digest(digraph, graph_format),
+        extension=graph_format.value,
+    )
+
+    if render_path.exists():
+        render_path.touch()
+        return render_path
+
+    if graph_format == GraphFormat.DOT:
+        rendered = digraph.source.encode()
+    else:
+        rendered = digraph.pipe(format=graph_format.value)
+
+    renders_path.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, so that an interrupted render never
+    # ends up in cache.
+    partial_path = render_path.with_suffix(f'.{os.getpid()}.partial')
+    partial_path.write_bytes(rendered)
+    partial_path.replace(render_path)
+
+    prune_renders(renders_path)
+    return render_path
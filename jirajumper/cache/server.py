@@ -0,0 +1,15 @@
+from datetime import datetime, timedelta, timezone
+
+from pydantic import BaseModel
+
+
+class ServerCache(BaseModel):
+    """Metadata of a particular JIRA server, downloaded at some moment."""
+
+    server: str
+    retrieved_at: datetime
+
+    def is_fresh(self, server: str, ttl: timedelta) -> bool:
+        """Find out if the metadata belongs to the server and is not stale."""
+        age = datetime.now(tz=timezone.utc) - self.retrieved_at
+        return self.server == server and age < ttl
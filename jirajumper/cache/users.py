@@ -0,0 +1,207 @@
+"""
+JIRA users, downloaded once and searched locally.
+
+`--assignee` may be a display name or an email address, possibly misspelled;
+searching a local copy of the user directory resolves it without a request to
+JIRA.
+"""
+import difflib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from documented import DocumentedError
+from jira import JIRA
+from pydantic import BaseModel
+
+from jirajumper.cache.server import ServerCache
+
+# JIRA returns at most 1,000 users per page.
+USER_PAGE_SIZE = 1000
+
+# How similar to a user name or email a misspelled query must be, 0 to 1.
+FUZZY_CUTOFF = 0.6
+
+
+class DirectoryUser(BaseModel):
+    """A JIRA user, as much as `jj` needs to know about them."""
+
+    user_id: str
+    display_name: str
+    email: Optional[str] = None
+
+    @property
+    def search_keys(self) -> List[str]:
+        """Strings a user might type to mean this user, in lower case."""
+        search_keys = [self.display_name.lower(), self.user_id.lower()]
+
+        if self.email:
+            email = self.email.lower()
+            search_keys.extend([email, email.split('@')[0]])
+
+        return search_keys
+
+    def __str__(self) -> str:
+        """Display name, with email if known."""
+        if self.email:
+            return f'{self.display_name} <{self.email}>'
+
+        return self.display_name
+
+
+@dataclass
+class UserNotFound(DocumentedError):
+    """
+    No JIRA user matches `{self.query}`.
+
+    Please specify a display name or an email address. If the user has joined
+    recently, run `jj cache refresh` to download the list of users again.
+    """
+
+    query: str
+
+
+@dataclass
+class AmbiguousUser(DocumentedError):
+    """
+    Several JIRA users match `{self.query}`:
+
+    {self.formatted_users}
+
+    Please be more specific, for instance, use an email address.
+    """
+
+    query: str
+    users: List[DirectoryUser]
+
+    @property
+    def formatted_users(self) -> str:
+        """List the matching users."""
+        return '\n'.join(f'  - {user}' for user in self.users)
+
+
+def unique_users(users: List[DirectoryUser]) -> List[DirectoryUser]:
+    """Drop repeated users, keeping the order."""
+    return list({user.user_id: user for user in users}.values())
+
+
+class UserDirectory(ServerCache):
+    """Active users of a particular JIRA server."""
+
+    users: List[DirectoryUser]
+
+    def find(self, query: str) -> DirectoryUser:
+        """
+        Find the user meant by a query.
+
+        Exact matches win over substring matches, and those over misspelled
+        names or emails.
+        """
+        normalized_query = query.strip().lower()
+
+        for is_match in (
+            lambda search_key: search_key == normalized_query,
+            lambda search_key: normalized_query in search_key,
+        ):
+            matching_users = unique_users([
+                user
+                for user in self.users
+                if any(map(is_match, user.search_keys))
+            ])
+
+            if len(matching_users) == 1:
+                return matching_users[0]
+
+            if matching_users:
+                raise AmbiguousUser(query=query, users=matching_users)
+
+        return self.find_similar(query, normalized_query)
+
+    def find_similar(self, query: str, normalized_query: str) -> DirectoryUser:
+        """Find the user whose name or email looks the most like the query."""
+        user_by_search_key = {
+            search_key: user
+            for user in self.users
+            for search_key in user.search_keys
+        }
+
+        close_matches = difflib.get_close_matches(
+            normalized_query,
+            user_by_search_key,
+            n=len(user_by_search_key),
+            cutoff=FUZZY_CUTOFF,
+        )
+        if not close_matches:
+            raise UserNotFound(query=query)
+
+        def similarity(search_key: str) -> float:  # noqa: WPS430
+            return difflib.SequenceMatcher(
+                None,
+                normalized_query,
+                search_key,
+            ).ratio()
+
+        best_similarity = similarity(close_matches[0])
+        best_users = unique_users([
+            user_by_search_key[search_key]
+            for search_key in close_matches
+            if similarity(search_key) == best_similarity
+        ])
+
+        if len(best_users) > 1:
+            raise AmbiguousUser(query=query, users=best_users)
+
+        return best_users[0]
+
+
+def iterate_raw_users(client: JIRA) -> Iterator[Dict[str, Any]]:
+    """Download all active users, page by page."""
+    if client._is_cloud:  # noqa: WPS437
+        path, params = 'users/search', {}
+    else:
+        # `.` matches every user of JIRA Server and Data Center.
+        path, params = 'user/search', {'username': '.'}
+
+    start_at = 0
+    while True:
+        page = client._session.get(  # noqa: WPS437
+            client._get_url(path),  # noqa: WPS437
+            params={
+                **params,
+                'startAt': start_at,
+                'maxResults': USER_PAGE_SIZE,
+            },
+        ).json()
+
+        yield from page
+
+        # Cloud may return fewer users than requested before the last page.
+        if not page:
+            return
+
+        start_at += len(page)
+
+
+def directory_user(client: JIRA, raw_user: Dict[str, Any]) -> DirectoryUser:
+    """Convert a user returned by JIRA."""
+    user_id_field = 'accountId' if client._is_cloud else 'name'  # noqa: WPS437
+    return DirectoryUser(
+        user_id=raw_user[user_id_field],
+        display_name=raw_user.get('displayName') or raw_user[user_id_field],
+        email=raw_user.get('emailAddress') or None,
+    )
+
+
+def fetch_user_directory(client: JIRA) -> UserDirectory:
+    """Download active human users of JIRA."""
+    return UserDirectory(
+        server=client.server_url,
+        retrieved_at=datetime.now(tz=timezone.utc),
+        users=[
+            directory_user(client, raw_user)
+            for raw_user in iterate_raw_users(client)
+            if raw_user.get('active', True) and (
+                raw_user.get('accountType', 'atlassian') == 'atlassian'
+            )
+        ],
+    )
@@ -0,0 +1,106 @@
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+RawTransition = Dict[str, Any]
+
+
+class WorkflowTransition(BaseModel):
+    """JIRA workflow transition, as observed on an issue."""
+
+    transition_id: str = Field(alias='id')
+    name: str
+    destination: str
+
+    class Config:
+        allow_population_by_field_name = True
+
+    @classmethod
+    def from_raw(cls, raw_transition: RawTransition) -> 'WorkflowTransition':
+        """Parse a transition returned by `JIRA.transitions()`."""
+        return cls(
+            transition_id=str(raw_transition['id']),
+            name=raw_transition['name'],
+            destination=raw_transition['to']['name'],
+        )
+
+
+TransitionPath = List[WorkflowTransition]
+
+
+class Workflow(BaseModel):
+    """
+    The part of a JIRA workflow learned so far.
+
+    JIRA only tells which transitions are available from the current status
+    of an issue; this remembers them for every status we have seen.
+    """
+
+    transitions_by_status: Dict[str, List[WorkflowTransition]] = Field(
+        default_factory=dict,
+    )
+
+    def is_explored(self, status: str) -> bool:
+        """Find out if transitions from this status are known."""
+        return status in self.transitions_by_status
+
+    def learn(
+        self,
+        status: str,
+        raw_transitions: Iterable[RawTransition],
+    ) -> None:
+        """Remember transitions available from a status."""
+        self.transitions_by_status[status] = [
+            WorkflowTransition.from_raw(raw_transition)
+            for raw_transition in raw_transitions
+        ]
+
+    def forget(self, status: str) -> None:
+        """Forget transitions from a status, for instance, if outdated."""
+        self.transitions_by_status.pop(status, None)
+
+    def find_path(
+        self,
+        source: str,
+        is_destination: Callable[[str], bool],
+    ) -> Optional[TransitionPath]:
+        """
+        Find the shortest chain of known transitions to a matching status.
+
+        Return an empty list if the source status matches itself, and `None`
+        if no matching status is reachable.
+        """
+        path_by_status: Dict[str, TransitionPath] = {source: []}
+        statuses = deque([source])
+
+        while statuses:
+            status = statuses.popleft()
+            path = path_by_status[status]
+
+            if is_destination(status):
+                return path
+
+            for transition in self.transitions_by_status.get(status, []):
+                if transition.destination not in path_by_status:
+                    path_by_status[transition.destination] = [
+                        *path,
+                        transition,
+                    ]
+                    statuses.append(transition.destination)
+
+        return None
+
+
+class WorkflowCache(BaseModel):
+    """Workflows of a JIRA server, by project and issue type."""
+
+    server: str
+    workflows: Dict[str, Workflow] = Field(default_factory=dict)
+
+    def workflow(self, project: str, issue_type: str) -> Workflow:
+        """Workflow of issues of a type in a project, possibly empty."""
+        return self.workflows.setdefault(
+            f'{project}/{issue_type}',
+            Workflow(),
+        )
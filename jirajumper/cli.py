@@ -1,30 +1,88 @@
+import importlib
 import logging
 import sys
+from datetime import timedelta
 from enum import Enum
-from functools import partial
 from itertools import filterfalse
 from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Type
 
 import click
 import rich
-from rich.traceback import install
 from typer import Context, Option, Typer
-from typer.core import TyperArgument, TyperCommand
-
-from jirajumper.cache.cache import GlobalOptions, field_key_by_name
-from jirajumper.client import jira
-from jirajumper.commands.clone import clone
-from jirajumper.commands.fork import fork
-from jirajumper.commands.graph import graph
-from jirajumper.commands.link import link
-from jirajumper.commands.list_issues import list_issues
-from jirajumper.commands.select import jump
-from jirajumper.commands.status import status
-from jirajumper.commands.update import update
-from jirajumper.fields import FIELDS, JiraField, JiraFieldsRepository
+from typer.core import TyperArgument, TyperCommand, TyperGroup
+from typer.main import get_command_from_info, get_group
+from typer.models import CommandInfo
+
+from jirajumper.cache.cache import GlobalOptions, WarmOptions
+from jirajumper.cache.completion import field_completion
+from jirajumper.entrypoint import DEFAULT_CACHE_PATH
+from jirajumper.fields import FIELDS
 from jirajumper.models import OutputFormat
 
+
+class LazyCommand(NamedTuple):
+    """
+    Command which is only imported when it is invoked.
+
+    `import_path`, like `jirajumper.commands.select:jump`, points to a command
+    function or to a Typer app implementing a command group.
+    """
+
+    import_path: str
+    cls: Optional[Type[click.Command]] = None
+    context_settings: Optional[Dict[str, Any]] = None
+
+    def load(self, name: str) -> click.Command:
+        """Import the command and convert it to a Click command."""
+        module_name, attribute_name = self.import_path.split(':')
+        implementation = getattr(
+            importlib.import_module(module_name),
+            attribute_name,
+        )
+
+        if isinstance(implementation, Typer):
+            group = get_group(implementation)
+            group.name = name
+            return group
+
+        return get_command_from_info(
+            CommandInfo(
+                name=name,
+                cls=self.cls,
+                context_settings=self.context_settings,
+                callback=implementation,
+            ),
+        )
+
+
+class LazyGroup(TyperGroup):
+    """
+    Import command modules only when their commands are invoked.
+
+    Some of them depend on heavy libraries which most of `jj` calls do not
+    need, like `graphviz`.
+    """
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List commands without importing them."""
+        return sorted({*super().list_commands(ctx), *LAZY_COMMANDS})
+
+    def get_command(
+        self,
+        ctx: click.Context,
+        cmd_name: str,
+    ) -> Optional[click.Command]:
+        """Import the command, if it has not been imported yet."""
+        lazy_command = LAZY_COMMANDS.get(cmd_name)
+        if cmd_name not in self.commands and lazy_command is not None:
+            self.add_command(lazy_command.load(cmd_name), cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+
 app = Typer(
+    cls=LazyGroup,
     help='Manage JIRA issues.',
     no_args_is_help=True,
 )
@@ -54,10 +112,26 @@ def global_options(
         help='Format to print the data in',
     ),
     cache_path: Path = Option(
-        default=Path.home() / '.cache/jirajumper/jirajumper.json',
+        default=DEFAULT_CACHE_PATH,
         envvar='JIRAJUMPER_CACHE_PATH',
         help='Path to the JSON file where jirajumper will store its cache.',
     ),
+    cache_ttl: int = Option(
+        24,
+        envvar='JIRAJUMPER_CACHE_TTL',
+        help=(
+            'How long, in hours, JIRA server metadata (such as the list of '
+            'issue fields) is cached before being downloaded again.'
+        ),
+    ),
+    remote: bool = Option(
+        False,
+        '--remote',
+        help=(
+            'Query JIRA directly even if issues have been mirrored locally '
+            'by `jj sync`.'
+        ),
+    ),
     log_level: LogLevel = Option(   # noqa: WPS404, B008
         LogLevel.ERROR,
         help=(
@@ -70,33 +144,29 @@ def global_options(
     logger = logging.getLogger('jj')
 
     if log_level == LogLevel.DEBUG:
+        # `rich.traceback` imports `pygments`, which takes a while.
+        from rich.traceback import install  # noqa: WPS433
+
         install(show_locals=False)
         logger.setLevel(logging.DEBUG)
     else:
         sys.excepthook = exception_handler
         logger.setLevel(logging.ERROR)
 
-    client = jira()
-    key_by_name = field_key_by_name(
-        jira=client,
-    )
-
-    resolved_fields = map(
-        partial(
-            JiraField.resolve,
-            field_key_by_name=key_by_name,
-        ),
-        FIELDS,
-    )
-
-    context.obj = GlobalOptions(
+    options = GlobalOptions(
         logger=logger,
         output_format=format,
-        jira=jira(),
-        fields=JiraFieldsRepository(resolved_fields),
         cache_path=cache_path,
+        cache_ttl=timedelta(hours=cache_ttl),
+        use_mirror=not remote,
     )
 
+    # `jj daemon` keeps options, with their caches, between commands.
+    if isinstance(context.obj, WarmOptions):
+        options = context.obj.reuse(options)
+
+    context.obj = options
+
 
 class AutoOptionsCommand(TyperCommand):
     writable_only = False
@@ -117,6 +187,7 @@ class AutoOptionsCommand(TyperCommand):
                     option_name=field.human_name.replace("_", "-"),
                 )],
                 help=field.description,
+                autocompletion=field_completion(field.human_name),
             )
             for field in fields
         ]
@@ -144,45 +215,40 @@ class UpdateCommand(AutoOptionsCommand):
     mutable_only = True
 
 
-app.command()(jump)
-
-app.command(
-    cls=CloneCommand,
-    context_settings={
-        'ignore_unknown_options': True,
-    },
-)(clone)
-
-app.command(
-    cls=CloneCommand,
-    context_settings={
-        'ignore_unknown_options': True,
-    },
-)(fork)
-
-app.command(
-    cls=UpdateCommand,
-    context_settings={
-        'ignore_unknown_options': True,
-    },
-)(update)
-
-
-app.command(
-    cls=AutoOptionsCommand,
-    context_settings={
-        'ignore_unknown_options': True,
-    },
-    name='list',
-)(list_issues)
-
-app.command(
-    cls=AutoOptionsCommand,
-    context_settings={
-        'ignore_unknown_options': True,
-    },
-    name='graph',
-)(graph)
-
-app.command()(link)
-app.command()(status)
+IGNORE_UNKNOWN_OPTIONS = {  # noqa: WPS407
+    'ignore_unknown_options': True,
+}
+
+LAZY_COMMANDS = {  # noqa: WPS407
+    'jump': LazyCommand('jirajumper.commands.select:jump'),
+    'clone': LazyCommand(
+        'jirajumper.commands.clone:clone',
+        cls=CloneCommand,
+        context_settings=IGNORE_UNKNOWN_OPTIONS,
+    ),
+    'fork': LazyCommand(
+        'jirajumper.commands.fork:fork',
+        cls=CloneCommand,
+        context_settings=IGNORE_UNKNOWN_OPTIONS,
+    ),
+    'update': LazyCommand(
+        'jirajumper.commands.update:update',
+        cls=UpdateCommand,
+        context_settings=IGNORE_UNKNOWN_OPTIONS,
+    ),
+    'list': LazyCommand(
+        'jirajumper.commands.list_issues:list_issues',
+        cls=AutoOptionsCommand,
+        context_settings=IGNORE_UNKNOWN_OPTIONS,
+    ),
+    'graph': LazyCommand(
+        'jirajumper.commands.graph:graph',
+        cls=AutoOptionsCommand,
+        context_settings=IGNORE_UNKNOWN_OPTIONS,
+    ),
+    'link': LazyCommand('jirajumper.commands.link:link'),
+    'status': LazyCommand('jirajumper.commands.status:status'),
+    'sync': LazyCommand('jirajumper.commands.sync:sync'),
+    'cache': LazyCommand('jirajumper.commands.cache:cache_app'),
+    'daemon': LazyCommand('jirajumper.commands.daemon:daemon_app'),
+}
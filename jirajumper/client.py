@@ -1,10 +1,23 @@
+import json
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 
-from jira import JIRA
+from jira import JIRA, Issue, JIRAError
+from jira.resilientsession import raise_on_error
+from requests.adapters import HTTPAdapter
 
 from jirajumper.errors import MissingJiraCredentials
 
+# Enough for every worker of a concurrent command to keep its connection alive.
+CONNECTION_POOL_SIZE = 16
+
+# Number of issues requested per search page. JIRA may return fewer.
+SEARCH_PAGE_SIZE = 100
+
+# JIRA creates at most this many issues per `/issue/bulk` request.
+BULK_CREATE_SIZE = 50
+
 
 def env_server() -> Optional[str]:
     """Retrieve JIRA server address."""
@@ -21,8 +34,16 @@ def env_token() -> Optional[str]:
     return os.getenv('JIRA_TOKEN')
 
 
+@lru_cache(maxsize=None)
 def jira() -> JIRA:
-    """Construct an instance of Jira client and establish an HTTP connection."""
+    """
+    Construct the Jira client, once per process.
+
+    No request is sent at this point: server info is not requested (see
+    `GlobalOptions.jira` which restores it from cache), and the connection is
+    established by the first actual API call. All calls share one pool of
+    keep-alive connections.
+    """
     server = env_server()
     username = env_username()
     token = env_token()
@@ -34,15 +55,66 @@ def jira() -> JIRA:
             token=token,
         )
 
-    return JIRA(
+    client = JIRA(
         server=server,
         basic_auth=(
             username,
             token,
         ),
+        get_server_info=False,
+    )
+
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=CONNECTION_POOL_SIZE,
+    )
+    client._session.mount('https://', adapter)  # noqa: WPS437
+    client._session.mount('http://', adapter)  # noqa: WPS437
+
+    return client
+
+
+def issue_from_raw(raw: Dict[str, Any], server: str) -> Issue:
+    """Construct an issue object from its JSON without contacting JIRA."""
+    return Issue(
+        options={**JIRA.DEFAULT_OPTIONS, 'server': server},
+        session=None,
+        raw=raw,
     )
 
 
+def iterate_issues(
+    client: JIRA,
+    jql: str,
+    limit: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+) -> Iterator[Issue]:
+    """
+    Search for issues page by page, yielding each page as soon as it arrives.
+
+    Stops requesting pages as soon as `limit` issues have been yielded. Only
+    the given `fields` are requested, if specified.
+    """
+    yielded_count = 0
+
+    while limit is None or yielded_count < limit:
+        page_size = SEARCH_PAGE_SIZE
+        if limit is not None:
+            page_size = min(page_size, limit - yielded_count)
+
+        page = client.search_issues(
+            jql,
+            startAt=yielded_count,
+            maxResults=page_size,
+            fields=fields or '*all',
+        )
+        yield from page
+        yielded_count += len(page)
+
+        if not page or yielded_count >= page.total:
+            return
+
+
 def issue_url(server: str, key: str) -> str:
     """Generate URL for a given issue."""
     return f'{server}/browse/{key}'
@@ -53,3 +125,69 @@ def custom_fields(client: JIRA):
 
     for field in fields:
         print(field)
+
+
+def update_issue(
+    client: JIRA,
+    issue_key: str,
+    issue_fields: Dict[str, Any],
+) -> None:
+    """
+    Set issue fields, given in JIRA format.
+
+    Unlike `Issue.update()`, does not download the issue afterwards.
+    """
+    client._session.put(  # noqa: WPS437
+        client._get_url(f'issue/{issue_key}'),  # noqa: WPS437
+        data=json.dumps({'fields': issue_fields}),
+    )
+
+
+def create_issue(
+    client: JIRA,
+    issue_fields: Dict[str, Any],
+    update: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Create an issue; return its key.
+
+    Unlike `JIRA.create_issue()`, accepts `update` operations, like adding
+    links, and does not download the issue afterwards.
+    """
+    response = client._session.post(  # noqa: WPS437
+        client._get_url('issue'),  # noqa: WPS437
+        data=json.dumps({'fields': issue_fields, 'update': update or {}}),
+    )
+    raise_on_error(response)
+
+    issue_key = response.json().get('key')
+    if issue_key is None:
+        raise JIRAError(
+            'JIRA did not return the key of the created issue.',
+            status_code=response.status_code,
+            response=response,
+        )
+
+    return issue_key
+
+
+def create_issue_link(
+    client: JIRA,
+    link_type_name: str,
+    inward_key: str,
+    outward_key: str,
+) -> None:
+    """
+    Link two issues.
+
+    Unlike `JIRA.create_issue_link()`, does not download link types first.
+    """
+    response = client._session.post(  # noqa: WPS437
+        client._get_url('issueLink'),  # noqa: WPS437
+        data=json.dumps({
+            'type': {'name': link_type_name},
+            'inwardIssue': {'key': inward_key},
+            'outwardIssue': {'key': outward_key},
+        }),
+    )
+    raise_on_error(response)
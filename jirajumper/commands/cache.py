@@ -0,0 +1,31 @@
+import rich
+from typer import Typer
+
+from jirajumper.cache.cache import JeevesJiraContext
+
+cache_app = Typer(
+    help='Manage jirajumper local cache.',
+    no_args_is_help=True,
+)
+
+
+@cache_app.command()
+def refresh(context: JeevesJiraContext):
+    """Download JIRA server metadata and store it in jirajumper cache."""
+    field_metadata = context.obj.refresh_field_metadata()
+    rich.print(
+        f'Cached {len(field_metadata.issue_fields)} issue fields '
+        f'of {field_metadata.server}.',
+    )
+
+    link_types = context.obj.refresh_link_types()
+    rich.print(
+        f'Cached {len(link_types.link_types)} issue link types '
+        f'of {link_types.server}.',
+    )
+
+    user_directory = context.obj.refresh_user_directory()
+    rich.print(
+        f'Cached {len(user_directory.users)} users '
+        f'of {user_directory.server}.',
+    )
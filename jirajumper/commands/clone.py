@@ -1,30 +1,254 @@
-from typing import Optional
+import csv
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, TextIO
 
-from jira import JIRAError
+import rich
+from documented import DocumentedError
+from jira import JIRA, Issue, JIRAError
+from more_itertools import chunked
+from typer import Argument, BadParameter, FileText, Option
 
 from jirajumper import default_options
 from jirajumper.cache.cache import JeevesJiraContext
+from jirajumper.client import BULK_CREATE_SIZE, issue_url
 from jirajumper.commands.select import jump
-from jirajumper.commands.update import JIRAUpdateFailed, assign
+from jirajumper.commands.update import (
+    JIRAUpdateFailed,
+    assignee_payload,
+    user_payload,
+)
+from jirajumper.fields import JiraFieldsRepository
 
+IssueRow = Dict[str, str]
 
-def clone(
+
+@dataclass
+class BulkCloneFailed(DocumentedError):
+    """
+    Cannot create {self.failed_count} of {self.total_count} JIRA issues 🙁.
+
+    {self.formatted_failures}
+
+    Issues created: {self.formatted_created_keys}
+    """
+
+    failures: Dict[int, JIRAUpdateFailed]
+    total_count: int
+    created_keys: List[str]
+
+    @property
+    def failed_count(self) -> int:
+        """Number of issues that were not created."""
+        return len(self.failures)
+
+    @property
+    def formatted_failures(self) -> str:
+        """Format errors of every input row."""
+        return '\n'.join(
+            f'Row {row_number}:\n{failure.formatted_errors}'
+            for row_number, failure in self.failures.items()
+        )
+
+    @property
+    def formatted_created_keys(self) -> str:
+        """List keys of the issues which were created nevertheless."""
+        return ', '.join(self.created_keys) or 'none'
+
+
+def read_issue_rows(
+    source: TextIO,
+    fields: JiraFieldsRepository,
+) -> List[IssueRow]:
+    """
+    Read field values of new issues from CSV or JSON Lines.
+
+    Column names (or JSON keys) are field names, like `summary` or
+    `assignee`; JSON Lines are recognized by the leading `{`.
+    """
+    text = source.read()
+
+    if text.lstrip().startswith('{'):
+        raw_rows = [
+            json.loads(line)
+            for line in text.splitlines()
+            if line.strip()
+        ]
+    else:
+        raw_rows = list(csv.DictReader(text.splitlines()))
+
+    rows = [
+        {
+            column.strip().replace('-', '_'): str(cell_value).strip()
+            for column, cell_value in raw_row.items()
+            if column and cell_value is not None
+        }
+        for raw_row in raw_rows
+    ]
+
+    known_columns = {field.human_name for field in fields.writable()}
+    known_columns.add('assignee')
+    unknown_columns = {
+        column
+        for row in rows
+        for column in row
+    } - known_columns
+
+    if unknown_columns:
+        raise BadParameter(
+            'Unknown fields: {columns}.'.format(
+                columns=', '.join(sorted(unknown_columns)),
+            ),
+            param_hint='--from-file',
+        )
+
+    return rows
+
+
+def parent_fields(context: JeevesJiraContext, parent_issue: Issue):
+    """Retrieve writable field values of an issue, for its clones."""
+    return dict(
+        field.store(field.retrieve(issue=parent_issue))
+        for field in context.obj.fields
+        if field.is_writable()
+    )
+
+
+def parent_assignee_payload(
+    jira: JIRA,
+    parent_issue: Issue,
+) -> Optional[Dict[str, str]]:
+    """Assign clones to the assignee of the parent, with no user search."""
+    parent_assignee = parent_issue.fields.assignee
+    if not parent_assignee:
+        return None
+
+    return user_payload(
+        jira=jira,
+        user_id=jira._get_user_identifier(parent_assignee),  # noqa: WPS437
+    )
+
+
+def bulk_clone(  # noqa: WPS210
+    context: JeevesJiraContext,
+    rows: List[IssueRow],
+    assignee: Optional[str],
+    options: Dict[str, str],
+) -> List[Issue]:
+    """Create an issue per row, with the selected issue as template."""
+    jira = context.obj.jira
+    fields = context.obj.fields.writable()
+
+    parent_issue = context.obj.current_issue
+    template_fields = {
+        **parent_fields(context=context, parent_issue=parent_issue),
+        **dict(
+            field.store(human_value)
+            for field, human_value in fields.match_options(options)
+        ),
+    }
+
+    assignee_by_name: Dict[Optional[str], Optional[Dict[str, str]]] = {
+        None: parent_assignee_payload(jira=jira, parent_issue=parent_issue),
+    }
+
+    field_list = []
+    for row in rows:
+        issue_fields: Dict[str, Any] = {
+            **template_fields,
+            **dict(
+                field.store(human_value)
+                for field, human_value in fields.match_options(row)
+            ),
+        }
+
+        row_assignee = row.get('assignee') or assignee
+        if row_assignee and row_assignee not in assignee_by_name:
+            assignee_by_name[row_assignee] = assignee_payload(
+                context=context,
+                assignee=row_assignee,
+            )
+
+        issue_assignee = assignee_by_name.get(row_assignee)
+        if issue_assignee:
+            issue_fields['assignee'] = issue_assignee
+
+        field_list.append(issue_fields)
+
+    issues = []
+    failures = {}
+    for chunk_number, chunk in enumerate(chunked(field_list, BULK_CREATE_SIZE)):
+        context.obj.logger.info(
+            'Creating issues %s to %s...',
+            chunk_number * BULK_CREATE_SIZE + 1,
+            chunk_number * BULK_CREATE_SIZE + len(chunk),
+        )
+        results = jira.create_issues(field_list=chunk, prefetch=False)
+
+        for row_index, result in enumerate(results):
+            if result['issue'] is not None:
+                issues.append(result['issue'])
+                continue
+
+            row_number = chunk_number * BULK_CREATE_SIZE + row_index + 1
+            failures[row_number] = JIRAUpdateFailed(
+                errors=result['error'],
+                fields=fields,
+            )
+
+    if failures:
+        raise BulkCloneFailed(
+            failures=failures,
+            total_count=len(field_list),
+            created_keys=[issue.key for issue in issues],
+        )
+
+    for issue in issues:
+        url = issue_url(context.obj.server, issue.key)
+        rich.print(f'[bold]{issue.key}[/bold] {url}')
+
+    return issues
+
+
+def clone(  # noqa: WPS211
     context: JeevesJiraContext,
     stay: bool = False,
     assignee: Optional[str] = default_options.ASSIGNEE,
-    summary: str = default_options.SUMMARY,
+    summary: Optional[str] = Argument(  # noqa: WPS404, B008
+        None,
+        help='Issue summary. Not needed with `--from-file`.',
+    ),
+    from_file: Optional[FileText] = Option(  # noqa: WPS404, B008
+        None,
+        '--from-file',
+        help=(
+            'Create an issue per row of a CSV or JSON Lines file (`-` for '
+            'stdin), with field names as columns. Options of this command '
+            'apply to every row; selected issue remains selected.'
+        ),
+    ),
     **options: str,
 ):
     """Clone a JIRA issue."""
+    if from_file is not None:
+        return bulk_clone(
+            context=context,
+            rows=read_issue_rows(source=from_file, fields=context.obj.fields),
+            assignee=assignee,
+            options={**options, 'summary': summary},
+        )
+
+    if not summary:
+        raise BadParameter('Issue summary is required.', param_hint='SUMMARY')
+
     options.update({
         'summary': summary,
     })
 
     parent_issue = context.obj.current_issue
-    parent_issue_fields = dict(
-        field.store(field.retrieve(issue=parent_issue))
-        for field in context.obj.fields
-        if field.is_writable()
+    parent_issue_fields = parent_fields(
+        context=context,
+        parent_issue=parent_issue,
     )
 
     resolved_fields = context.obj.fields.match_options(options)
@@ -39,24 +263,25 @@ def clone(
         **update_fields,
     }
 
+    if assignee:
+        issue_assignee = assignee_payload(context=context, assignee=assignee)
+    else:
+        issue_assignee = parent_assignee_payload(
+            jira=context.obj.jira,
+            parent_issue=parent_issue,
+        )
+
+    if issue_assignee:
+        new_issue_fields['assignee'] = issue_assignee
+
     try:
         issue = context.obj.jira.create_issue(fields=new_issue_fields)
     except JIRAError as err:
-        raise JIRAUpdateFailed(
-            errors=err.response.json().get('errors', {}),
+        raise JIRAUpdateFailed.from_error(
+            err,
             fields=context.obj.fields,
         ) from err
 
-    if not assignee:
-        assignee = getattr(parent_issue.fields.assignee, 'displayName', None)
-
-    if assignee:
-        assign(
-            jira=context.obj.jira,
-            key=issue.key,
-            assignee=assignee,
-        )
-
     if not stay:
         jump(
             context=context,
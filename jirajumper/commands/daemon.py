@@ -0,0 +1,71 @@
+import subprocess  # noqa: S404
+import sys
+import time
+
+import rich
+from typer import Typer
+
+from jirajumper.cache.cache import JeevesJiraContext
+
+# How long `jj daemon start` waits for the daemon to listen, in seconds.
+START_TIMEOUT = 10
+
+daemon_app = Typer(
+    help='Run jirajumper commands faster by a background process.',
+    no_args_is_help=True,
+)
+
+
+@daemon_app.command()
+def serve(context: JeevesJiraContext):
+    """Run the daemon in foreground."""
+    from jirajumper.daemon import serve as serve_forever  # noqa: WPS433
+
+    socket_path = context.obj.daemon_socket_path
+    rich.print(f'Listening on {socket_path}.')
+    serve_forever(socket_path)
+
+
+@daemon_app.command()
+def start(context: JeevesJiraContext):
+    """Start the daemon in background; `jj` will forward commands to it."""
+    from jirajumper.daemon import is_listening  # noqa: WPS433
+
+    socket_path = context.obj.daemon_socket_path
+
+    subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            '-m',
+            'jirajumper',
+            '--cache-path',
+            str(context.obj.cache_path),
+            'daemon',
+            'serve',
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while not is_listening(socket_path):
+        if time.monotonic() > deadline:
+            rich.print('[red]jj daemon did not start.[/red]')
+            raise SystemExit(1)
+
+        time.sleep(0.1)  # noqa: WPS432
+
+    rich.print(f'jj daemon is listening on {socket_path}.')
+
+
+@daemon_app.command()
+def stop(context: JeevesJiraContext):
+    """Stop the daemon."""
+    from jirajumper.daemon import request_shutdown  # noqa: WPS433
+
+    if request_shutdown(context.obj.daemon_socket_path):
+        rich.print('jj daemon stopped.')
+    else:
+        rich.print('jj daemon is not running.')
@@ -1,42 +1,159 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import rich
-from jira import JIRAError
+from jira import JIRA, JIRAError
 from typer import Option
 
 from jirajumper import default_options
-from jirajumper.cache.cache import JeevesJiraContext
-from jirajumper.commands.clone import clone
-from jirajumper.commands.link import LinkType, link
-from jirajumper.commands.select import jump
-from jirajumper.commands.update import JIRAUpdateFailed
+from jirajumper.cache.cache import (
+    JeevesJiraContext,
+    JiraCache,
+    ResolvedLinkType,
+)
+from jirajumper.client import create_issue, create_issue_link, issue_url
+from jirajumper.commands.clone import parent_assignee_payload, parent_fields
+from jirajumper.commands.link import resolve_link_type
+from jirajumper.commands.update import JIRAUpdateFailed, assignee_payload
+from jirajumper.fields import JiraFieldsRepository
 
 
-def fork(
+def link_payload(
+    link_type: ResolvedLinkType,
+    parent_issue_key: str,
+) -> Dict[str, Any]:
+    """
+    Link the issue being created to its parent.
+
+    The parent is on the left side of the link: `PROJ-1 blocks <new issue>`.
+    """
+    # The issue being created takes the side which is not specified.
+    parent_side = 'outwardIssue' if link_type.is_inward else 'inwardIssue'
+
+    return {
+        'add': {
+            'type': {'name': link_type.name},
+            parent_side: {'key': parent_issue_key},
+        },
+    }
+
+
+def create_linked_issue(
+    jira: JIRA,
+    issue_fields: Dict[str, Any],
+    link_type: ResolvedLinkType,
+    parent_issue_key: str,
+    fields: JiraFieldsRepository,
+) -> str:
+    """
+    Create an issue linked to its parent; return its key.
+
+    The link is sent along with the new issue. If JIRA refuses it because
+    Linked Issues are not on the create screen of the project, the link is
+    created by a separate request.
+    """
+    try:
+        return create_issue(
+            client=jira,
+            issue_fields=issue_fields,
+            update={
+                'issuelinks': [
+                    link_payload(
+                        link_type=link_type,
+                        parent_issue_key=parent_issue_key,
+                    ),
+                ],
+            },
+        )
+    except JIRAError as err:
+        rejected_fields = JIRAUpdateFailed.from_error(err, fields=fields).errors
+        if 'issuelinks' not in rejected_fields:
+            raise
+
+    child_issue_key = create_issue(client=jira, issue_fields=issue_fields)
+
+    inward_key, outward_key = parent_issue_key, child_issue_key
+    if link_type.is_inward:
+        inward_key, outward_key = outward_key, inward_key
+
+    create_issue_link(
+        client=jira,
+        link_type_name=link_type.name,
+        inward_key=inward_key,
+        outward_key=outward_key,
+    )
+
+    return child_issue_key
+
+
+def fork(  # noqa: WPS210, WPS211
     context: JeevesJiraContext,
-    link_type: LinkType = Option(LinkType.BLOCKS, '--link'),
+    link_type: str = Option(
+        'blocks',
+        '--link',
+        help='Link type, like `blocks` or `relates-to`.',
+    ),
     stay: bool = False,
     assignee: Optional[str] = default_options.ASSIGNEE,
     summary: str = default_options.SUMMARY,
     **options: str,
 ):
-    """Fork a JIRA issue."""
-    child_issue = clone(
-        context=context,
-        stay=True,
-        assignee=assignee,
-        summary=summary,
-        **options,
-    )
+    """
+    Fork a JIRA issue.
+
+    The child issue is created, assigned and linked to the selected issue by
+    one request to JIRA, unless the create screen has no Linked Issues.
+    """
+    resolved_link_type = resolve_link_type(context, link_type)
+
+    jira = context.obj.jira
+    fields = context.obj.fields
+    parent_issue = context.obj.current_issue
+
+    options.update({
+        'summary': summary,
+    })
+
+    issue_fields = {
+        **parent_fields(context=context, parent_issue=parent_issue),
+        **dict(
+            field.store(human_value)
+            for field, human_value in fields.match_options(options)
+        ),
+    }
 
-    link(
-        context=context,
-        link_type=link_type,
-        specifiers=[child_issue.key],
+    if assignee:
+        issue_assignee = assignee_payload(context=context, assignee=assignee)
+    else:
+        issue_assignee = parent_assignee_payload(
+            jira=jira,
+            parent_issue=parent_issue,
+        )
+
+    if issue_assignee:
+        issue_fields['assignee'] = issue_assignee
+
+    try:
+        child_issue_key = create_linked_issue(
+            jira=jira,
+            issue_fields=issue_fields,
+            link_type=resolved_link_type,
+            parent_issue_key=parent_issue.key,
+            fields=fields,
+        )
+    except JIRAError as err:
+        raise JIRAUpdateFailed.from_error(err, fields=fields) from err
+
+    rich.print(
+        f'* {parent_issue.key} {resolved_link_type.description} '
+        f'[bold]{child_issue_key}[/bold] {summary}',
     )
+    rich.print(issue_url(context.obj.server, child_issue_key))
 
     if not stay:
-        jump(
-            context=context,
-            specifier=child_issue.key,
+        context.obj.store_cache(
+            JiraCache(
+                selected_issue_key=child_issue_key,
+            ),
         )
+
+    return child_issue_key
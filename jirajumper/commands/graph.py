@@ -1,12 +1,46 @@
 import html
+import shutil
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from enum import Enum
+from functools import partial
+from pathlib import Path
 from types import MappingProxyType
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 import graphviz
+import rich
+from jira import Issue
+from more_itertools import bucket, chunked
+from typer import Option
 
+from jirajumper import default_options
 from jirajumper.cache.cache import JeevesJiraContext
+from jirajumper.cache.renders import GraphFormat, cached_render
 from jirajumper.client import issue_url
-from jirajumper.commands.list_issues import generate_jql
+from jirajumper.commands.list_issues import (
+    SEARCH_FIELDS,
+    find_issues,
+    find_issues_by_keys,
+    with_required_fields,
+)
+from jirajumper.concurrency import map_concurrently
+from jirajumper.fields.field import ResolvedField
+
+GRAPH_FIELDS = ('type', 'summary', 'assignee', 'status', 'epic')
+
+# Keeps `key IN (...)` and alike queries well within JQL length limits.
+KEYS_PER_SEARCH = 50
 
 DEFAULT_COLOR_MAP = MappingProxyType({
     'Code Review': '#BD34D1',  # Pink
@@ -29,83 +63,208 @@ DEFAULT_COLOR_MAP = MappingProxyType({
 })
 
 
-def graph(
+class GraphEngine(str, Enum):  # noqa: WPS600
+    """Graphviz layout engines suitable for the roadmap."""
+
+    DOT = 'dot'
+    SFDP = 'sfdp'
+    FDP = 'fdp'
+    NEATO = 'neato'
+
+
+class GraphStyle(NamedTuple):
+    """How to draw the roadmap."""
+
+    engine: GraphEngine = GraphEngine.DOT
+    cluster_epics: bool = False
+    collapse_done: bool = False
+    compact: bool = False
+
+
+class EpicProgress(NamedTuple):
+    """How many issues of an epic are done."""
+
+    done_count: int = 0
+    total_count: int = 0
+
+
+def is_done(issue: Issue) -> bool:
+    """Find out if the issue is done."""
+    return issue.fields.status.statusCategory.name == 'Done'
+
+
+def is_open_epic(issue: Issue) -> bool:
+    """Find out if the issue is an epic which is not done yet."""
+    return issue.fields.issuetype.name == 'Epic' and not is_done(issue)
+
+
+def epic_children_statuses(
+    epic_keys: List[str],
     context: JeevesJiraContext,
-    **options,
-):
-    """List JIRA issues by criteria."""
-    jql = generate_jql(
-        fields=context.obj.fields,
-        options=options,
+) -> List[Tuple[str, bool]]:
+    """Retrieve `(epic key, is done)` pairs for children of given epics."""
+    fields = context.obj.fields
+    epic_field = fields.find_by_human_name('epic')
+
+    epic_children = find_issues(
+        context=context,
+        options={'epic': ','.join(epic_keys)},
+        search_fields=fields.search_fields(['status', 'epic']),
     )
 
-    logger = context.obj.logger
-    logger.info('JQL: `%s`', jql)
+    return [
+        (
+            epic_field.retrieve(issue=child),
+            is_done(child),
+        )
+        for child in epic_children
+    ]
 
-    jira = context.obj.jira
-    issues = jira.search_issues(jql, maxResults=None)
 
-    graph = graphviz.Digraph(
-        comment='Jira task links',
-        graph_attr={
-            'rankdir': 'LR',
-        }
+def epic_progress(
+    context: JeevesJiraContext,
+    epic_keys: Iterable[str],
+    concurrency: int,
+) -> Dict[str, EpicProgress]:
+    """Count done and total children of epics, a chunk of epics per search."""
+    children_statuses_by_chunk = map_concurrently(
+        partial(epic_children_statuses, context=context),
+        chunked(epic_keys, KEYS_PER_SEARCH),
+        concurrency=concurrency,
+        logger=context.obj.logger,
     )
-    for issue in issues:
-        color = DEFAULT_COLOR_MAP.get(
-            issue.fields.status.name,
-            'white',
-        )
 
-        wrapped_summary = '<br/>'.join(
-            textwrap.wrap(
-                html.escape(issue.fields.summary.replace('"', '')),
-                width=20,
+    progress_by_epic: Dict[str, EpicProgress] = {}
+    for children_statuses in children_statuses_by_chunk:
+        for epic_key, is_done in children_statuses:
+            done_count, total_count = progress_by_epic.get(
+                epic_key,
+                EpicProgress(),
             )
+            progress_by_epic[epic_key] = EpicProgress(
+                done_count=done_count + int(is_done),
+                total_count=total_count + 1,
+            )
+
+    return progress_by_epic
+
+
+def linked_issue_keys(issue: Issue) -> Iterator[str]:
+    """Keys of the issues linked to given one, in either direction."""
+    for link in issue.fields.issuelinks:
+        linked_issue = (
+            getattr(link, 'inwardIssue', None) or
+            getattr(link, 'outwardIssue', None)
         )
+        if linked_issue:
+            yield linked_issue.key
+
+
+def expand_links(
+    context: JeevesJiraContext,
+    issues: List[Issue],
+    depth: int,
+    search_fields: List[str],
+    concurrency: int,
+) -> List[Issue]:
+    """
+    Add issues linked to the given ones, breadth first, up to `depth` hops.
+
+    Every level of the link graph is retrieved with `key IN (...)` searches.
+    """
+    visited_keys = {issue.key for issue in issues}
+    frontier = issues
+
+    for _level in range(depth):
+        frontier_keys = sorted({
+            linked_key
+            for issue in frontier
+            for linked_key in linked_issue_keys(issue)
+        } - visited_keys)
 
-        if (
-            issue.fields.issuetype.name == 'Epic' and
-            issue.fields.status.statusCategory.name != 'Done'
-        ):
-            logger.info('Retrieving children for epic %s...', issue)
-            epic_children = jira.search_issues(
-                f'"Epic Link" = {issue.key}',
-                maxResults=None,
+        if not frontier_keys:
+            break
+
+        visited_keys.update(frontier_keys)
+        frontier = [
+            issue
+            for chunk_issues in map_concurrently(
+                partial(
+                    find_issues_by_keys,
+                    context=context,
+                    search_fields=search_fields,
+                ),
+                chunked(frontier_keys, KEYS_PER_SEARCH),
+                concurrency=concurrency,
+                logger=context.obj.logger,
             )
-            total_count = len(epic_children)
-            done_count = len([
-                issue
-                for issue in epic_children
-                if issue.fields.status.statusCategory.name == 'Done'
-            ])
-            progress = f'<I>[{done_count} of {total_count}]</I>'
-        else:
-            progress = ''
-
-        label = textwrap.dedent(f'''
-            <TABLE BGCOLOR="{color}" BORDER="0" CELLBORDER="1" CELLSPACING="0">
-                <TR><TD ALIGN="left"><B>{issue.key}</B> <I>{issue.fields.issuetype}</I></TD></TR>
-                <TR><TD ALIGN="left">{wrapped_summary}</TD></TR>
-                <TR><TD ALIGN="left">{issue.fields.assignee}</TD></TR>
-                <TR><TD ALIGN="left">{issue.fields.status} {progress}</TD></TR>
-            </TABLE>
-        ''')
-
-        graph.node(
-            issue.key,
-            f'<{label}>',
-            shape='none',
-            href=issue_url(context.obj.jira.server_url, issue.key),
-            target='_blank',
+            for issue in chunk_issues
+        ]
+        issues = [*issues, *frontier]
+
+    return issues
+
+
+def epic_key_of(issue: Issue, epic_field: ResolvedField) -> Optional[str]:
+    """Key of the epic the issue belongs to; for an epic, its own key."""
+    if issue.fields.issuetype.name == 'Epic':
+        return issue.key
+
+    return epic_field.retrieve(issue=issue)
+
+
+def issue_label(issue: Issue, progress: str, compact: bool) -> str:
+    """Describe the issue in a graph node."""
+    if compact:
+        return f'{issue.key}\n{textwrap.shorten(issue.fields.summary, 40)}'
+
+    color = DEFAULT_COLOR_MAP.get(
+        issue.fields.status.name,
+        'white',
+    )
+
+    wrapped_summary = '<br/>'.join(
+        textwrap.wrap(
+            html.escape(issue.fields.summary.replace('"', '')),
+            width=20,
         )
+    )
+
+    label = textwrap.dedent(f'''
+        <TABLE BGCOLOR="{color}" BORDER="0" CELLBORDER="1" CELLSPACING="0">
+            <TR><TD ALIGN="left"><B>{issue.key}</B> <I>{issue.fields.issuetype}</I></TD></TR>
+            <TR><TD ALIGN="left">{wrapped_summary}</TD></TR>
+            <TR><TD ALIGN="left">{issue.fields.assignee}</TD></TR>
+            <TR><TD ALIGN="left">{issue.fields.status} {progress}</TD></TR>
+        </TABLE>
+    ''')
+
+    return f'<{label}>'
+
 
-        links = issue.fields.issuelinks
-        for link in links:
+def draw_edges(
+    digraph: graphviz.Digraph,
+    issues: List[Issue],
+    node_by_issue_key: Dict[str, str],
+) -> None:
+    """Draw issue links; links to collapsed issues lead to their summaries."""
+    drawn_edges = set()
+
+    for issue in issues:
+        head = node_by_issue_key.get(issue.key, issue.key)
+
+        for link in issue.fields.issuelinks:
             linked_issue = getattr(link, 'inwardIssue', None)
             if not linked_issue:
                 continue
 
+            tail = node_by_issue_key.get(linked_issue.key, linked_issue.key)
+            edge = (tail, head, link.type.name)
+            if tail == head or edge in drawn_edges:
+                continue
+
+            drawn_edges.add(edge)
+
             if (
                 linked_issue.fields.status.name == 'Put On Ice' and
                 issue.fields.status.name in {'In Progress', 'Queued'}
@@ -114,15 +273,237 @@ def graph(
             else:
                 edge_options = {}
 
-            graph.edge(
-                linked_issue.key,
-                issue.key,
-                link.type.name,
-                **edge_options,
-            )
+            digraph.edge(*edge, **edge_options)
 
-    graph.render(
-        '/tmp/jeeves-jira-roadmap',
-        format='png',
-        view=True,
+
+def draw(  # noqa: WPS210, WPS231
+    issues: List[Issue],
+    progress_by_epic: Dict[str, EpicProgress],
+    epic_field: ResolvedField,
+    server: str,
+    style: GraphStyle,
+) -> graphviz.Digraph:
+    """
+    Draw the roadmap.
+
+    Depending on the style, issues of an epic are grouped into a cluster, and
+    done issues of an epic are collapsed into one summary node.
+    """
+    digraph = graphviz.Digraph(
+        comment='Jira task links',
+        engine=style.engine.value,
+        graph_attr={
+            'rankdir': 'LR',
+            'overlap': 'false',
+        },
     )
+
+    issues_by_epic = bucket(
+        issues,
+        key=partial(epic_key_of, epic_field=epic_field),
+    )
+
+    # Collapsed issues are represented by summary nodes.
+    node_by_issue_key: Dict[str, str] = {}
+
+    for epic_key in sorted(issues_by_epic, key=str):
+        if style.cluster_epics and epic_key:
+            container = digraph.subgraph(name=f'cluster_{epic_key}')
+        else:
+            container = nullcontext(digraph)
+
+        with container as subgraph:
+            done_issues = []
+            for issue in issues_by_epic[epic_key]:
+                if style.collapse_done and is_done(issue):
+                    done_issues.append(issue)
+                    continue
+
+                if is_open_epic(issue):
+                    done_count, total_count = progress_by_epic.get(
+                        issue.key,
+                        EpicProgress(),
+                    )
+                    progress = f'<I>[{done_count} of {total_count}]</I>'
+                else:
+                    progress = ''
+
+                subgraph.node(
+                    issue.key,
+                    issue_label(issue, progress, compact=style.compact),
+                    shape='box' if style.compact else 'none',
+                    href=issue_url(server, issue.key),
+                    target='_blank',
+                )
+
+            if done_issues:
+                summary_node = f'{epic_key or "No epic"} (done)'
+                subgraph.node(
+                    summary_node,
+                    f'{len(done_issues)} done issues',
+                    shape='box',
+                    style='dashed',
+                )
+                node_by_issue_key.update({
+                    done_issue.key: summary_node
+                    for done_issue in done_issues
+                })
+
+    draw_edges(
+        digraph=digraph,
+        issues=issues,
+        node_by_issue_key=node_by_issue_key,
+    )
+    return digraph
+
+
+def graph(  # noqa: WPS211, WPS210
+    context: JeevesJiraContext,
+    search_fields: Optional[str] = SEARCH_FIELDS,
+    concurrency: int = default_options.CONCURRENCY,
+    depth: int = Option(
+        0,
+        min=0,
+        help=(
+            'Also draw issues linked to the matching ones, following links '
+            'up to this many hops away.'
+        ),
+    ),
+    graph_format: GraphFormat = Option(
+        GraphFormat.PNG,
+        '--format',
+        help='Format of the rendered graph; `dot` is the Graphviz source.',
+    ),
+    output: Optional[Path] = Option(
+        None,
+        help=(
+            'File to save the rendered graph to; with `--split`, directory '
+            'to save the graphs of all epics to.'
+        ),
+    ),
+    view: bool = Option(
+        True,
+        help='Open the rendered graph in default viewer.',
+    ),
+    engine: GraphEngine = Option(
+        GraphEngine.DOT,
+        help='Graphviz layout engine; `sfdp` is the fastest on large graphs.',
+    ),
+    cluster_epics: bool = Option(
+        False,
+        '--cluster-epics',
+        help='Group issues of every epic together.',
+    ),
+    collapse_done: bool = Option(
+        False,
+        '--collapse-done',
+        help='Draw done issues of every epic as a single node.',
+    ),
+    compact: bool = Option(
+        False,
+        '--compact',
+        help='Label issues with key and summary only.',
+    ),
+    split: bool = Option(
+        False,
+        '--split',
+        help='Render every epic as a separate graph, in parallel processes.',
+    ),
+    **options,
+):
+    """Draw a graph of JIRA issues matching criteria and links among them."""
+    fields = context.obj.fields
+    graph_search_fields = with_required_fields(
+        search_fields,
+        required_fields=[*fields.search_fields(GRAPH_FIELDS), 'issuelinks'],
+    )
+
+    issues = expand_links(
+        context=context,
+        issues=list(find_issues(
+            context=context,
+            options=options,
+            search_fields=graph_search_fields,
+        )),
+        depth=depth,
+        search_fields=graph_search_fields,
+        concurrency=concurrency,
+    )
+
+    progress_by_epic = epic_progress(
+        context=context,
+        epic_keys=[issue.key for issue in issues if is_open_epic(issue)],
+        concurrency=concurrency,
+    )
+
+    draw_issues = partial(
+        draw,
+        progress_by_epic=progress_by_epic,
+        epic_field=fields.find_by_human_name('epic'),
+        server=context.obj.server,
+        style=GraphStyle(
+            engine=engine,
+            cluster_epics=cluster_epics,
+            collapse_done=collapse_done,
+            compact=compact,
+        ),
+    )
+    render = partial(
+        cached_render,
+        graph_format=graph_format,
+        renders_path=context.obj.renders_path,
+    )
+
+    if split:
+        render_split(
+            issues=issues,
+            epic_field=fields.find_by_human_name('epic'),
+            draw_issues=draw_issues,
+            render=render,
+            output=output,
+        )
+        return
+
+    render_path = render(draw_issues(issues))
+
+    if output:
+        render_path = Path(shutil.copyfile(render_path, output))
+
+    context.obj.logger.info('Graph rendered to %s', render_path)
+
+    if view:
+        graphviz.view(render_path)
+
+
+def render_split(
+    issues: List[Issue],
+    epic_field: ResolvedField,
+    draw_issues: Callable[[List[Issue]], graphviz.Digraph],
+    render: Callable[[graphviz.Digraph], Path],
+    output: Optional[Path],
+) -> None:
+    """Render a separate graph for every epic, in parallel processes."""
+    issues_by_epic = bucket(
+        issues,
+        key=partial(epic_key_of, epic_field=epic_field),
+    )
+    epic_keys = sorted(issues_by_epic, key=str)
+    digraphs = [
+        draw_issues(list(issues_by_epic[epic_key]))
+        for epic_key in epic_keys
+    ]
+
+    with ProcessPoolExecutor() as executor:
+        render_paths = list(executor.map(render, digraphs))
+
+    for epic_key, render_path in zip(epic_keys, render_paths):
+        epic_name = epic_key or 'no-epic'
+
+        if output:
+            output.mkdir(parents=True, exist_ok=True)
+            render_path = Path(shutil.copyfile(
+                render_path,
+                output / f'{epic_name}{render_path.suffix}',
+            ))
+
+        rich.print(f'{epic_name}: {render_path}')
@@ -1,74 +1,147 @@
+import asyncio
+from dataclasses import dataclass
 from enum import Enum
 from types import MappingProxyType
-from typing import List, Set
+from typing import Dict, List, Optional, Set
 
 import rich
+from documented import DocumentedError
 from jira import JIRA, Issue
 from typer import Argument
 
-from jirajumper.cache.cache import JeevesJiraContext
+from jirajumper import default_options
+from jirajumper.async_client import AsyncJira, run_async
+from jirajumper.cache.cache import JeevesJiraContext, ResolvedLinkType
+from jirajumper.cache.completion import complete_issue_key
 from jirajumper.commands.select import normalize_issue_specifier
 
 
-class LinkType(str, Enum):   # noqa: WPS600
+class LinkAction(str, Enum):   # noqa: WPS600
+    """Actions `jj link` supports besides creating links."""
+
+    REMOVE = 'remove'
+    CONFLUENCE = 'confluence'
+    LIST = 'list'
+
+
+@dataclass
+class UnknownLinkType(DocumentedError):
     """
-    Supported Jira link types.
+    Unknown issue link type: `{self.link_type}`.
+
+    Link types supported by this JIRA server:
+    {self.formatted_link_types}
 
-    # FIXME Can we deduce that dynamically and store in cache?
+    Other actions: {self.formatted_actions}.
     """
 
-    SPLIT_FROM = 'split-from'
-    SPLIT_TO = 'split-to'
+    link_type: str
+    link_type_by_slug: Dict[str, ResolvedLinkType]
 
-    RELATES_TO = 'relates-to'
+    @property
+    def formatted_link_types(self) -> str:
+        """List link type choices."""
+        return '\n'.join(
+            f'  - {slug}'
+            for slug in sorted(self.link_type_by_slug)
+        )
 
-    IS_CAUSED_BY = 'is-caused-by'
-    CAUSES = 'causes'
+    @property
+    def formatted_actions(self) -> str:
+        """List link actions."""
+        return ', '.join(action.value for action in LinkAction)
 
-    IS_DUPLICATED_BY = 'is-duplicated-by'
-    DUPLICATES = 'duplicates'
 
-    DEPENDS_ON = 'deps'
-    DEPENDED_ON_BY = 'dep'
+def resolve_link_type(
+    context: JeevesJiraContext,
+    link_type: str,
+) -> ResolvedLinkType:
+    """Find the link type by CLI choice, like `is-blocked-by`."""
+    link_type_by_slug = context.obj.link_types.by_slug
+
+    try:
+        return link_type_by_slug[link_type.lower()]
+    except KeyError as err:
+        raise UnknownLinkType(
+            link_type=link_type,
+            link_type_by_slug=link_type_by_slug,
+        ) from err
+
+
+def linked_issue_key(existing_link) -> str:
+    """Key of the issue at the other end of a link."""
+    linked_issue = getattr(
+        existing_link, 'outwardIssue', None,
+    ) or existing_link.inwardIssue
+
+    return linked_issue.key
+
+
+async def create_link(
+    jira: AsyncJira,
+    link_type: ResolvedLinkType,
+    issue_key: str,
+    other_issue_key: str,
+):
+    """
+    Link an issue to another one.
 
-    IS_BLOCKED_BY = 'is-blocked-by'
-    BLOCKS = 'blocks'
+    Unlike `JIRA.create_issue_link()`, does not download link types each time.
+    """
+    inward_key, outward_key = issue_key, other_issue_key
+    if link_type.is_inward:
+        inward_key, outward_key = outward_key, inward_key
+
+    await jira.post(
+        'issueLink',
+        body={
+            'type': {'name': link_type.name},
+            'inwardIssue': {'key': inward_key},
+            'outwardIssue': {'key': outward_key},
+        },
+    )
+    rich.print(f'* {issue_key} {link_type.description} {other_issue_key}.')
 
-    REMOVE = 'remove'
-    CONFLUENCE = 'confluence'
-    LIST = 'list'
 
-    @property
-    def jira_name(self):
-        """Jira native name of the transition."""
-        return self.name.lower().replace('_', ' ')
+async def delete_link(jira: AsyncJira, issue_key: str, existing_link):
+    """Delete a link."""
+    await jira.delete(f'issueLink/{existing_link.id}')
+    rich.print(
+        f'{issue_key} and {linked_issue_key(existing_link)} '
+        f'are no longer connected.',
+    )
 
 
 def remove_link(
     current_issue: Issue,
     issue_keys: Set[str],
-    link_type: LinkType,
+    link_type: Optional[ResolvedLinkType],
     jira: JIRA,
+    concurrency: int,
 ):
     """Remove links to a number of issues."""
-    for existing_link in current_issue.fields.issuelinks:
-        linked_issue = getattr(
-            existing_link, 'outwardIssue', None,
-        ) or existing_link.inwardIssue
-
-        if linked_issue.key in issue_keys:
-            jira.delete_issue_link(existing_link.id)
-            rich.print(
-                f'{current_issue.key} and {linked_issue.key} '
-                f'are no longer connected.',
-            )
+    removed_links = [
+        existing_link
+        for existing_link in current_issue.fields.issuelinks
+        if linked_issue_key(existing_link) in issue_keys
+    ]
+
+    run_async(
+        client=jira,
+        concurrency=concurrency,
+        operation=lambda async_jira: asyncio.gather(*[
+            delete_link(async_jira, current_issue.key, existing_link)
+            for existing_link in removed_links
+        ]),
+    )
 
 
 def link_confluence(
     current_issue: Issue,
     issue_keys: Set[str],
-    link_type: LinkType,
+    link_type: Optional[ResolvedLinkType],
     jira: JIRA,
+    concurrency: int,
 ):
     """Remove links to a number of issues."""
     raise NotImplementedError('Linking to Confluence is not yet implemented.')
@@ -77,53 +150,88 @@ def link_confluence(
 def list_links(
     current_issue: Issue,
     issue_keys: Set[str],
-    link_type: LinkType,
+    link_type: Optional[ResolvedLinkType],
     jira: JIRA,
+    concurrency: int,
 ):
     """Remove links to a number of issues."""
     rich.print('Issue links:')
     for existing_link in current_issue.fields.issuelinks:
-        linked_issue = getattr(
-            existing_link, 'outwardIssue', None,
-        ) or existing_link.inwardIssue
+        issue_key = linked_issue_key(existing_link)
 
-        if linked_issue.key in issue_keys:
+        if issue_key in issue_keys:
             rich.print(
-                f'  * {current_issue.key} {existing_link} {linked_issue.key}',
+                f'  * {current_issue.key} {existing_link} {issue_key}',
             )
 
 
 def link_default(
     current_issue: Issue,
     issue_keys: Set[str],
-    link_type: LinkType,
+    link_type: ResolvedLinkType,
     jira: JIRA,
+    concurrency: int,
 ):
-    """Create a link between issues."""
-    for issue_key in issue_keys:
-        jira.create_issue_link(
-            type=link_type.jira_name,
-            inwardIssue=current_issue.key,
-            outwardIssue=issue_key,
+    """Create links between issues, unless they already exist."""
+    existing_keys = {
+        linked_issue_key(existing_link)
+        for existing_link in current_issue.fields.issuelinks
+        if existing_link.type.name == link_type.name and (
+            hasattr(existing_link, 'inwardIssue') == link_type.is_inward
         )
+    }
+
+    for issue_key in sorted(issue_keys & existing_keys):
         rich.print(
-            f'* {current_issue} {link_type} {issue_key}.',
+            f'* {current_issue.key} {link_type.description} {issue_key} '
+            f'already.',
         )
 
+    run_async(
+        client=jira,
+        concurrency=concurrency,
+        operation=lambda async_jira: asyncio.gather(*[
+            create_link(
+                jira=async_jira,
+                link_type=link_type,
+                issue_key=current_issue.key,
+                other_issue_key=issue_key,
+            )
+            for issue_key in sorted(issue_keys - existing_keys)
+        ]),
+    )
+
 
 LINK_MANAGERS = MappingProxyType({
-    LinkType.CONFLUENCE: link_confluence,
-    LinkType.REMOVE: remove_link,
-    LinkType.LIST: list_links,
+    LinkAction.CONFLUENCE: link_confluence,
+    LinkAction.REMOVE: remove_link,
+    LinkAction.LIST: list_links,
 })
 
 
 def link(
     context: JeevesJiraContext,
-    link_type: LinkType,
-    specifiers: List[str] = Argument(None),  # noqa: WPS404, B008
+    link_type: str = Argument(  # noqa: WPS404, B008
+        ...,
+        help=(
+            'Link type, like `blocks` or `is-blocked-by`, as described by '
+            'JIRA; or `remove`, `list`.'
+        ),
+    ),
+    specifiers: List[str] = Argument(  # noqa: WPS404, B008
+        None,
+        autocompletion=complete_issue_key,
+    ),
+    concurrency: int = default_options.CONCURRENCY,
 ):
     """Link current issue to some other issue."""
+    linker = LINK_MANAGERS.get(link_type)
+    resolved_link_type = None
+
+    if linker is None:
+        linker = link_default
+        resolved_link_type = resolve_link_type(context, link_type)
+
     parent_issue = context.obj.current_issue
     jira = context.obj.jira
 
@@ -136,14 +244,10 @@ def link(
         for specifier in specifiers or []
     }
 
-    linker = LINK_MANAGERS.get(
-        link_type,
-        link_default,
-    )
-
     return linker(
         current_issue=parent_issue,
         issue_keys=issue_keys,
-        link_type=link_type,
+        link_type=resolved_link_type,
         jira=jira,
+        concurrency=concurrency,
     )
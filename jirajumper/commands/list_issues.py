@@ -1,10 +1,39 @@
-from typing import Dict
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
 
 import rich
+from jira import Issue
+from typer import BadParameter, Option
 
 from jirajumper.cache.cache import JeevesJiraContext
+from jirajumper.cache.completion import MAX_ISSUE_KEYS
+from jirajumper.client import issue_from_raw, iterate_issues
 from jirajumper.fields import JiraFieldsRepository
-from jirajumper.fields.field import ResolvedField
+from jirajumper.fields.field import ResolvedField, parse_expression
+
+LISTED_FIELDS = ('status', 'assignee', 'summary')
+
+SEARCH_FIELDS = Option(
+    None,
+    '--fields',
+    help=(
+        'Comma separated JIRA field names to request, in addition to the '
+        'fields jj needs to print the results.'
+    ),
+)
+
+
+def with_required_fields(
+    search_fields: Optional[str],
+    required_fields: List[str],
+) -> List[str]:
+    """Add fields requested by `--fields` to those `jj` cannot do without."""
+    requested_fields = [
+        search_field.strip()
+        for search_field in (search_fields or '').split(',')
+        if search_field.strip()
+    ]
+    return list(dict.fromkeys([*required_fields, *requested_fields]))
 
 
 def generate_jql(
@@ -23,24 +52,215 @@ def generate_jql(
     return ' AND '.join(expressions)
 
 
+def mirrored_projects(
+    context: JeevesJiraContext,
+    options: Dict[str, str],
+) -> Optional[List[str]]:
+    """
+    Choose projects to search in the local mirror, if it can answer at all.
+
+    The mirror only knows issues of the projects synced into it, so the
+    search must be limited to some of those by `--project`.
+    """
+    mirror = context.obj.mirror
+    project_expression = options.get('project')
+    if mirror is None or not project_expression:
+        return None
+
+    is_positive, project_keys = parse_expression(project_expression)
+    project_keys = [project_key.upper() for project_key in project_keys]
+    synced_projects = {project.upper() for project in mirror.projects()}
+
+    if is_positive and synced_projects.issuperset(project_keys):
+        return project_keys
+
+    return None
+
+
+def find_issues(
+    context: JeevesJiraContext,
+    options: Dict[str, str],
+    limit: Optional[int] = None,
+    search_fields: Optional[List[str]] = None,
+) -> Iterable[Issue]:
+    """
+    Find issues by criteria, in the local mirror if it has them all.
+
+    Issues are produced lazily, as they are retrieved. `search_fields` limit
+    the issue fields requested from JIRA.
+    """
+    projects = mirrored_projects(context=context, options=options)
+
+    if projects is None:
+        jql = generate_jql(
+            fields=context.obj.fields,
+            options=options,
+        )
+        context.obj.logger.info('JQL: `%s`', jql)
+        return iterate_issues(
+            client=context.obj.jira,
+            jql=jql,
+            limit=limit,
+            fields=search_fields,
+        )
+
+    context.obj.logger.info('Searching the local issue mirror.')
+    fields_and_values = context.obj.fields.match_options(options)
+
+    field: ResolvedField
+    mirrored_issues = (
+        issue_from_raw(raw_issue, server=context.obj.server)
+        for raw_issue in context.obj.mirror.raw_issues(projects)
+    )
+    matching_issues = (
+        issue
+        for issue in mirrored_issues
+        if all(
+            field.matches(issue=issue, expression=expression)
+            for field, expression in fields_and_values
+        )
+    )
+    return islice(matching_issues, limit)
+
+
+def find_issues_by_keys(
+    issue_keys: List[str],
+    context: JeevesJiraContext,
+    search_fields: Optional[List[str]] = None,
+) -> List[Issue]:
+    """
+    Retrieve issues by keys, from the local mirror if it has them.
+
+    Issues of projects not synced into the mirror are retrieved from JIRA
+    with one search.
+    """
+    mirror = context.obj.mirror
+    issues = []
+
+    if mirror is not None:
+        synced_projects = {project.upper() for project in mirror.projects()}
+        mirrored_issues = [
+            mirror.raw_issue(issue_key)
+            for issue_key in issue_keys
+            if issue_key.split('-')[0].upper() in synced_projects
+        ]
+        issues = [
+            issue_from_raw(raw_issue, server=context.obj.server)
+            for raw_issue in mirrored_issues
+            if raw_issue
+        ]
+
+    found_keys = {issue.key for issue in issues}
+    missing_keys = [
+        issue_key
+        for issue_key in issue_keys
+        if issue_key not in found_keys
+    ]
+    if missing_keys:
+        jql_keys = ', '.join(f'"{issue_key}"' for issue_key in missing_keys)
+        issues.extend(iterate_issues(
+            client=context.obj.jira,
+            jql=f'key IN ({jql_keys})',
+            fields=search_fields,
+        ))
+
+    return issues
+
+
+def parse_where(
+    where: List[str],
+    fields: JiraFieldsRepository,
+) -> Dict[str, str]:
+    """Parse `field=expression` filters into options for `generate_jql()`."""
+    filters = {}
+    for where_filter in where:
+        field_name, separator, expression = where_filter.partition('=')
+        human_name = field_name.strip().replace('-', '_')
+
+        if not separator or not expression:
+            raise BadParameter(
+                f'`{where_filter}` is not of form `field=expression`.',
+                param_hint='--where',
+            )
+
+        if fields.find_by_human_name(human_name) is None:
+            raise BadParameter(
+                f'`{field_name}` is not a known field.',
+                param_hint='--where',
+            )
+
+        filters[human_name] = expression
+
+    return filters
+
+
+def find_issues_where(
+    context: JeevesJiraContext,
+    where: List[str],
+    human_names: List[str],
+) -> List[Issue]:
+    """Search for issues matching `--where` filters, with given fields."""
+    fields = context.obj.fields
+    jql = generate_jql(
+        fields=fields,
+        options=parse_where(where, fields),
+    )
+    context.obj.logger.info('JQL: `%s`', jql)
+
+    issues = list(
+        iterate_issues(
+            client=context.obj.jira,
+            jql=jql,
+            fields=fields.search_fields(human_names),
+        ),
+    )
+    rich.print(f'{len(issues)} issues match `{jql}`.')
+
+    return issues
+
+
 def list_issues(
     context: JeevesJiraContext,
+    limit: Optional[int] = Option(
+        None,
+        help='Maximum number of issues to list.',
+    ),
+    search_fields: Optional[str] = SEARCH_FIELDS,
     **options,
 ):
     """List JIRA issues by criteria."""
-    jql = generate_jql(
-        fields=context.obj.fields,
+    fields = context.obj.fields
+    listed_fields = [
+        fields.find_by_human_name(human_name)
+        for human_name in LISTED_FIELDS
+    ]
+
+    issues = find_issues(
+        context=context,
         options=options,
+        limit=limit,
+        search_fields=with_required_fields(
+            search_fields,
+            required_fields=fields.search_fields(LISTED_FIELDS),
+        ),
     )
-    context.obj.logger.info('JQL: `%s`', jql)
-    issues = context.obj.jira.search_issues(jql, maxResults=None)
 
+    # The completion index keeps this many issues anyway; memory use should
+    # not grow with the number of issues listed.
+    indexed_issues: List[Issue] = []
     for issue in issues:
+        if len(indexed_issues) < MAX_ISSUE_KEYS:
+            indexed_issues.append(issue)
+
+        human_values = {
+            listed_field.human_name: listed_field.retrieve(issue=issue)
+            for listed_field in listed_fields
+        }
         rich.print(
             '* {key} [i]({status} / {assignee})[/i] {summary}'.format(
                 key=issue.key,
-                status=issue.fields.status,
-                assignee=issue.fields.assignee,
-                summary=issue.fields.summary,
+                **human_values,
             ),
         )
+
+    context.obj.index_for_completion(indexed_issues)
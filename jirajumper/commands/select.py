@@ -8,6 +8,7 @@ from jira import JIRA, JIRAError
 from typer import Argument, echo
 
 from jirajumper.cache.cache import JeevesJiraContext, JiraCache
+from jirajumper.cache.completion import complete_issue_key
 from jirajumper.client import issue_url
 from jirajumper.models import OutputFormat
 
@@ -17,7 +18,12 @@ def normalize_issue_specifier(
     specifier: str,
     current_issue_key: Optional[str],
 ):
-    """Normalize issue specifier."""
+    """
+    Normalize issue specifier.
+
+    For `next`, the current issue is downloaded afresh: statuses of the issues
+    it blocks may have changed since it was cached.
+    """
     if specifier.isnumeric() and current_issue_key:
         project_key, _current_issue_number = current_issue_key.split('-')
         return f'{project_key}-{specifier}'
@@ -28,7 +34,8 @@ def normalize_issue_specifier(
 
         if not links:
             raise ValueError(
-                f'Issue {current_issue_key} does not have any issues it blocks.',
+                f'Issue {current_issue_key} does not have any issues it '
+                'blocks.',
             )
 
         for link in links:
@@ -63,20 +70,22 @@ class NoIssueSelected(DocumentedError):
 @backoff.on_exception(backoff.expo, JIRAError, max_time=5)
 def jump(
     context: JeevesJiraContext,
-    specifier: Optional[str] = Argument(None),    # noqa: WPS404, B008
+    specifier: Optional[str] = Argument(  # noqa: WPS404, B008
+        None,
+        autocompletion=complete_issue_key,
+    ),
 ):
     """Select a Jira issue to work with."""
-    client = context.obj.jira
     cache = context.obj.cache
 
     if specifier:
         specifier = normalize_issue_specifier(
-            client=client,
+            client=context.obj.jira,
             specifier=specifier,
             current_issue_key=cache.selected_issue_key,
         )
 
-        issue = client.issue(specifier)
+        issue = context.obj.issue(specifier)
         cache.selected_issue_key = issue.key
 
         context.obj.store_cache(
@@ -90,11 +99,12 @@ def jump(
         if not key:
             raise NoIssueSelected()
 
-        issue = client.issue(cache.selected_issue_key)
+        # Not from the mirror: it is not updated when `jj` changes issues.
+        issue = context.obj.issue(key)
 
     if context.obj.output_format == OutputFormat.PRETTY:
         rich.print(f'[bold]{issue.key}[/bold] {issue.fields.summary}')
-        rich.print(issue_url(client.server_url, issue.key))
+        rich.print(issue_url(context.obj.server, issue.key))
 
         for print_field in context.obj.fields:
             field_value = print_field.retrieve(issue=issue)
@@ -1,12 +1,26 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Optional, List
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import rich
 from documented import DocumentedError
-from more_itertools import first
-from typer import Argument
+from jira import JIRA, Issue, JIRAError
+from more_itertools import map_reduce
+from rich.progress import Progress
+from typer import Argument, BadParameter, Option
 
+from jirajumper import default_options
+from jirajumper.async_client import AsyncJira, run_async
 from jirajumper.cache.cache import JeevesJiraContext
+from jirajumper.cache.workflows import (
+    RawTransition,
+    TransitionPath,
+    Workflow,
+    WorkflowTransition,
+)
+from jirajumper.client import update_issue
+from jirajumper.commands.list_issues import find_issues_where
 
 
 @dataclass
@@ -17,44 +31,476 @@ class NoTransitionFound(DocumentedError):
         - Source: {self.source_status}
         - Destination: {self.destination_status}
 
-    Transitive transitions are not yet supported ☹
+    The destination status is not reachable from the source status by the
+    workflow of this issue ☹
     """
 
     source_status: str
     destination_status: str
 
 
-def status(
+@dataclass
+class BulkTransitionFailed(DocumentedError):
+    """
+    Cannot move {self.failed_count} of {self.total_count} JIRA issues 🙁.
+
+    {self.formatted_failures}
+    """
+
+    failures: Dict[str, str]
+    total_count: int
+
+    @property
+    def failed_count(self) -> int:
+        """Number of issues that did not reach the destination status."""
+        return len(self.failures)
+
+    @property
+    def formatted_failures(self) -> str:
+        """Format error message of every issue."""
+        return '\n'.join(
+            f'  - {issue_key}: {error_message}'
+            for issue_key, error_message in self.failures.items()
+        )
+
+
+def is_status(status: str, status_name: str) -> bool:
+    """Compare status names, like JIRA does."""
+    return status.lower() == status_name.lower()
+
+
+def plan_transitions(
+    workflow: Workflow,
+    source_status: str,
+    destination_status: str,
+) -> TransitionPath:
+    """Choose the shortest known path from the source to the destination."""
+    path = workflow.find_path(
+        source_status,
+        lambda status: is_status(status, destination_status),
+    )
+
+    if path is None:
+        raise NoTransitionFound(
+            source_status=source_status,
+            destination_status=destination_status,
+        )
+
+    return path
+
+
+def sample_transitions(
+    jira: JIRA,
+    project: str,
+    issue_type: str,
+    status_name: str,
+) -> Optional[List[RawTransition]]:
+    """Read transitions JIRA offers for any issue in a status, if one exists."""
+    sample_issues = jira.search_issues(
+        f'project = "{project}" AND issuetype = "{issue_type}" '
+        f'AND status = "{status_name}"',
+        maxResults=1,
+        fields='status',
+    )
+    if not sample_issues:
+        return None
+
+    return jira.transitions(issue=sample_issues[0].key)
+
+
+def learn_workflow(
+    jira: JIRA,
+    workflow: Workflow,
+    issue: Issue,
+    destination_statuses: List[str],
+) -> None:
+    """
+    Learn enough of the workflow to walk the issue through the statuses.
+
+    Transitions from a status are read from an issue of the same project and
+    type which is in that status; no issue is moved to find out. Raise
+    `NoTransitionFound` if a destination is not reachable.
+    """
+    project = issue.fields.project.key
+    issue_type = issue.fields.issuetype.name
+    source_status = issue.fields.status.name
+    unlearnable: Set[str] = set()
+
+    if not workflow.is_explored(source_status):
+        workflow.learn(source_status, jira.transitions(issue=issue.key))
+
+    def is_unexplored(status_name: str) -> bool:  # noqa: WPS430
+        return (
+            status_name not in unlearnable and
+            not workflow.is_explored(status_name)
+        )
+
+    for destination_status in destination_statuses:
+        while True:
+            path = workflow.find_path(
+                source_status,
+                lambda status_name: is_status(status_name, destination_status),
+            )
+            if path is not None:
+                break
+
+            path_to_unexplored = workflow.find_path(
+                source_status,
+                is_unexplored,
+            )
+            if path_to_unexplored is None:
+                raise NoTransitionFound(
+                    source_status=source_status,
+                    destination_status=destination_status,
+                )
+
+            unexplored_status = (
+                path_to_unexplored[-1].destination
+                if path_to_unexplored else source_status
+            )
+            raw_transitions = sample_transitions(
+                jira=jira,
+                project=project,
+                issue_type=issue_type,
+                status_name=unexplored_status,
+            )
+            if raw_transitions is None:
+                unlearnable.add(unexplored_status)
+            else:
+                workflow.learn(unexplored_status, raw_transitions)
+
+        if path:
+            source_status = path[-1].destination
+
+
+def take_transition(
+    jira: JIRA,
+    issue_key: str,
+    transition: WorkflowTransition,
+    issue_fields: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Take a transition, setting issue fields by the same request if possible.
+
+    JIRA only accepts fields present on the transition screen; if it rejects
+    them, they are set by a separate request before the transition.
+    """
+    if issue_fields:
+        try:
+            jira.transition_issue(
+                issue=issue_key,
+                transition=transition.transition_id,
+                fields=issue_fields,
+            )
+        except JIRAError as err:
+            if err.status_code != HTTPStatus.BAD_REQUEST:
+                raise
+        else:
+            return
+
+        update_issue(
+            client=jira,
+            issue_key=issue_key,
+            issue_fields=issue_fields,
+        )
+
+    jira.transition_issue(
+        issue=issue_key,
+        transition=transition.transition_id,
+    )
+
+
+def transition_to_status(  # noqa: WPS211
+    jira: JIRA,
+    workflow: Workflow,
+    issue_key: str,
+    source_status: str,
+    destination_status: str,
+    issue_fields: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Walk an issue through the workflow to the destination status.
+
+    Only transitions known from the workflow, or offered by JIRA for the
+    issue, are taken; use `learn_workflow()` to know more of the workflow.
+    Issue fields, if any, are set along with the last transition. Return the
+    name of the status reached.
+    """
+    status = source_status
+    learned = set()
+
+    while not is_status(status, destination_status):
+        if not workflow.is_explored(status):
+            workflow.learn(status, jira.transitions(issue=issue_key))
+            learned.add(status)
+
+        path = plan_transitions(
+            workflow=workflow,
+            source_status=status,
+            destination_status=destination_status,
+        )
+
+        for transition in path:
+            is_last = is_status(transition.destination, destination_status)
+            try:
+                take_transition(
+                    jira=jira,
+                    issue_key=issue_key,
+                    transition=transition,
+                    issue_fields=issue_fields if is_last else None,
+                )
+            except JIRAError:
+                if status in learned:
+                    raise
+
+                # The workflow has changed since we learned it.
+                workflow.forget(status)
+                break
+
+            status = transition.destination
+            rich.print(f'  → {transition.name}: [bold]{status}[/bold]')
+
+    return status
+
+
+async def transition_group(
+    jira: AsyncJira,
+    workflow: Workflow,
+    issue_keys: List[str],
+    source_status: str,
+    destination_statuses: List[str],
+) -> Dict[str, str]:
+    """
+    Walk issues in the same status through the workflow concurrently.
+
+    Issues of a project and type share a workflow, which must be learned
+    beforehand. Return error messages by key of issues that did not make it.
+    """
+    errors: Dict[str, str] = {}
+
+    async def take_path(  # noqa: WPS430
+        issue_key: str,
+        path: TransitionPath,
+    ) -> None:
+        for transition in path:
+            await jira.post(
+                f'issue/{issue_key}/transitions',
+                body={'transition': {'id': transition.transition_id}},
+            )
+
+    for destination_status in destination_statuses:
+        issue_keys = [key for key in issue_keys if key not in errors]
+        try:
+            path = plan_transitions(
+                workflow=workflow,
+                source_status=source_status,
+                destination_status=destination_status,
+            )
+        except NoTransitionFound:
+            message = (
+                f'{destination_status} is not reachable from {source_status}.'
+            )
+            errors.update(dict.fromkeys(issue_keys, message))
+            break
+
+        results = await asyncio.gather(
+            *[take_path(issue_key, path) for issue_key in issue_keys],
+            return_exceptions=True,
+        )
+
+        if results and all(isinstance(result, JIRAError) for result in results):
+            # Probably, the workflow has changed since we learned it.
+            workflow.forget(source_status)
+
+        errors.update({
+            issue_key: getattr(result, 'text', None) or str(result)
+            for issue_key, result in zip(issue_keys, results)
+            if isinstance(result, Exception)
+        })
+
+        if path:
+            source_status = path[-1].destination
+
+    return errors
+
+
+def bulk_status(  # noqa: WPS210
+    context: JeevesJiraContext,
+    where: List[str],
+    destination_statuses: List[str],
+    dry_run: bool,
+    concurrency: int,
+):
+    """Move all issues matching the filters to destination statuses."""
+    issues = find_issues_where(
+        context=context,
+        where=where,
+        human_names=['project', 'type', 'status'],
+    )
+
+    keys_by_group = map_reduce(
+        issues,
+        keyfunc=lambda issue: (
+            issue.fields.project.key,
+            issue.fields.issuetype.name,
+            issue.fields.status.name,
+        ),
+        valuefunc=lambda issue: issue.key,
+    )
+
+    for (project, issue_type, group_status), group_keys in (
+        keys_by_group.items()
+    ):
+        rich.print(
+            f'  * {project} {issue_type} in {group_status}: {len(group_keys)}',
+        )
+
+    if dry_run:
+        return
+
+    workflow_cache = context.obj.workflow_cache
+    issue_by_key = {issue.key: issue for issue in issues}
+
+    for (project, issue_type, _group_status), group_keys in (
+        keys_by_group.items()
+    ):
+        try:
+            learn_workflow(
+                jira=context.obj.jira,
+                workflow=workflow_cache.workflow(project, issue_type),
+                issue=issue_by_key[group_keys[0]],
+                destination_statuses=destination_statuses,
+            )
+        except NoTransitionFound:
+            # Issues of the group will be reported as failed.
+            continue
+
+    async def transition_all(  # noqa: WPS430
+        jira: AsyncJira,
+        on_done: Callable[[int], None],
+    ) -> Dict[str, str]:
+        async def transition_one_group(  # noqa: WPS430
+            group: Tuple[str, str, str],
+            issue_keys: List[str],
+        ) -> Dict[str, str]:
+            project, issue_type, group_status = group
+            errors = await transition_group(
+                jira=jira,
+                workflow=workflow_cache.workflow(project, issue_type),
+                issue_keys=issue_keys,
+                source_status=group_status,
+                destination_statuses=destination_statuses,
+            )
+            on_done(len(keys_by_group[group]))
+            return errors
+
+        group_errors = await asyncio.gather(*[
+            transition_one_group(group, issue_keys)
+            for group, issue_keys in keys_by_group.items()
+        ])
+        return {
+            issue_key: error_message
+            for errors in group_errors
+            for issue_key, error_message in errors.items()
+        }
+
+    with Progress() as progress:
+        task = progress.add_task('Transitioning...', total=len(issues))
+        try:
+            errors = run_async(
+                client=context.obj.jira,
+                concurrency=concurrency,
+                operation=lambda jira: transition_all(
+                    jira=jira,
+                    on_done=lambda count: progress.advance(task, count),
+                ),
+            )
+        finally:
+            context.obj.store_workflow_cache()
+
+    if errors:
+        raise BulkTransitionFailed(
+            failures=errors,
+            total_count=len(issues),
+        )
+
+    rich.print(f'✔️ Status is now [bold]{destination_statuses[-1]}[/bold].')
+
+
+def status(  # noqa: WPS211
     context: JeevesJiraContext,
     status_values: Optional[List[str]] = Argument(None),
+    where: Optional[List[str]] = Option(  # noqa: WPS404, B008
+        None,
+        help=(
+            'Instead of the selected issue, transition all issues matching '
+            '`field=expression` filter, like `--where version=1.0`. '
+            'May be repeated.'
+        ),
+    ),
+    dry_run: bool = Option(
+        False,
+        '--dry-run',
+        help='With `--where`, only list issues which would be transitioned.',
+    ),
+    concurrency: int = default_options.CONCURRENCY,
 ):
     """Get or set issue status."""
+    if where and not status_values:
+        raise BadParameter(
+            'Specify the status to move the issues to.',
+            param_hint='--where',
+        )
+
+    if dry_run and not where:
+        raise BadParameter(
+            'Only transitions of many issues, with `--where`, can be dry run.',
+            param_hint='--dry-run',
+        )
+
+    if where:
+        bulk_status(
+            context=context,
+            where=where,
+            destination_statuses=status_values,
+            dry_run=dry_run,
+            concurrency=concurrency,
+        )
+        return
+
     issue = context.obj.current_issue
     jira = context.obj.jira
 
-    if status_values is None:
+    if not status_values:
         rich.print(issue.fields.status)
         return
 
-    for status in status_values:
-        transitions = jira.transitions(issue=issue.key)
+    workflow = context.obj.workflow_cache.workflow(
+        project=issue.fields.project.key,
+        issue_type=issue.fields.issuetype.name,
+    )
+
+    current_status = issue.fields.status.name
+    try:
+        learn_workflow(
+            jira=jira,
+            workflow=workflow,
+            issue=issue,
+            destination_statuses=status_values,
+        )
 
-        suitable_transitions = [
-            transition['name']
-            for transition in transitions
-            if transition['to']['name'].lower() == status.lower()
-        ]
+        for destination_status in status_values:
+            current_status = transition_to_status(
+                jira=jira,
+                workflow=workflow,
+                issue_key=issue.key,
+                source_status=current_status,
+                destination_status=destination_status,
+            )
+    finally:
+        context.obj.store_workflow_cache()
 
-        try:
-            target_transition = first(suitable_transitions)
-        except ValueError as err:
-            raise NoTransitionFound(
-                source_status=issue.fields.status.name,
-                destination_status=status,
-            ) from err
-
-        jira.transition_issue(
-            issue=issue.key,
-            transition=target_transition,
-        )
-        rich.print(f'✔️ Status is now [bold]{status}[/bold].')
+    if current_status != issue.fields.status.name:
+        current_status = context.obj.issue(issue.key).fields.status.name
+
+    rich.print(f'✔️ Status is now [bold]{current_status}[/bold].')
@@ -0,0 +1,86 @@
+import math
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import rich
+from documented import DocumentedError
+from jira import JIRA
+from typer import Option
+
+from jirajumper.cache.cache import JeevesJiraContext
+from jirajumper.cache.mirror import IssueMirror
+from jirajumper.client import SEARCH_PAGE_SIZE
+
+# Clocks of JIRA and of this machine may disagree a little.
+SYNC_MARGIN = timedelta(minutes=5)
+
+
+class NoProjectsToSync(DocumentedError):
+    """
+    No projects to sync.
+
+    Please specify JIRA projects to mirror locally, for instance:
+
+        jj sync --project PROJ
+
+    Afterwards, `jj sync` will keep updating the same projects.
+    """
+
+
+def sync_project(jira: JIRA, mirror: IssueMirror, project: str) -> int:
+    """Download issues of a project updated since its last sync."""
+    synced_at = datetime.now().astimezone()
+    last_sync = mirror.last_sync(project)
+
+    jql = f'project = "{project}"'
+    if last_sync:
+        # JQL reads absolute dates in the time zone of JIRA user profile,
+        # which may differ from ours; a relative date does not depend on it.
+        minutes_since = math.ceil(
+            (synced_at - last_sync + SYNC_MARGIN).total_seconds() / 60,
+        )
+        jql = f'{jql} AND updated >= "-{minutes_since}m"'
+
+    stored_count = 0
+    while True:
+        page = jira.search_issues(
+            f'{jql} ORDER BY updated ASC',
+            startAt=stored_count,
+            maxResults=SEARCH_PAGE_SIZE,
+            json_result=True,
+        )
+        raw_issues = page['issues']
+        stored_count += mirror.store(raw_issues)
+
+        if not raw_issues or stored_count >= page['total']:
+            break
+
+    mirror.mark_synced(project, synced_at)
+    return stored_count
+
+
+def sync(
+    context: JeevesJiraContext,
+    projects: Optional[List[str]] = Option(  # noqa: WPS404, B008
+        None,
+        '--project',
+        help='JIRA project key. By default, all previously synced projects.',
+    ),
+):
+    """Mirror JIRA issues locally, downloading only the updated ones."""
+    mirror = IssueMirror(path=context.obj.mirror_path)
+
+    if not projects and mirror.exists():
+        projects = mirror.projects()
+
+    if not projects:
+        raise NoProjectsToSync()
+
+    for project in projects:
+        context.obj.logger.info('Syncing %s...', project)
+        stored_count = sync_project(
+            jira=context.obj.jira,
+            mirror=mirror,
+            project=project,
+        )
+        rich.print(f'✔️ {project}: {stored_count} issues updated.')
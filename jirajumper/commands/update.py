@@ -1,12 +1,25 @@
-from dataclasses import dataclass
-from typing import Dict, Optional
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
 
 import rich
 from documented import DocumentedError
 from jira import JIRA, JIRAError
+from requests import RequestException, Response
+from rich.progress import Progress
+from typer import BadParameter, Option
 
 from jirajumper import default_options
+from jirajumper.async_client import AsyncJira, run_async
 from jirajumper.cache.cache import JeevesJiraContext
+from jirajumper.client import update_issue
+from jirajumper.commands.list_issues import find_issues_where
+from jirajumper.commands.select import NoIssueSelected
+from jirajumper.commands.status import (
+    is_status,
+    learn_workflow,
+    transition_to_status,
+)
 from jirajumper.fields import JiraFieldsRepository
 
 
@@ -21,47 +34,272 @@ class JIRAUpdateFailed(DocumentedError):
 
     errors: Dict[str, str]
     fields: JiraFieldsRepository
+    messages: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_error(
+        cls,
+        error: Exception,
+        fields: JiraFieldsRepository,
+    ) -> 'JIRAUpdateFailed':
+        """
+        Collect whatever JIRA has said about a failed request.
+
+        That is errors by field and general error messages, if the response
+        has them, or its text, or the error itself if there is no response.
+        """
+        response: Optional[Response] = getattr(error, 'response', None)
+        try:
+            response_json = response.json()
+        except (AttributeError, ValueError):
+            response_json = None
+
+        if not isinstance(response_json, dict):
+            response_json = {}
+
+        errors = response_json.get('errors') or {}
+        messages = response_json.get('errorMessages') or []
+
+        if not errors and not messages:
+            response_text = response.text if response is not None else None
+            messages = [
+                getattr(error, 'text', None) or response_text or str(error),
+            ]
+
+        return cls(errors=errors, fields=fields, messages=messages)
 
     @property
     def formatted_errors(self) -> str:
         """Format the error list received from JIRA."""
-        field_per_resolved_jira_name = {
-            field.jira_name: field
-            for field in self.fields
-        }
-
         error_by_field = [
-            (field_per_resolved_jira_name[jira_name], error_message)
+            (
+                getattr(
+                    self.fields.find_by_jira_name(jira_name),
+                    'human_name',
+                    jira_name,
+                ),
+                error_message,
+            )
             for jira_name, error_message in self.errors.items()
         ]
 
         return '\n'.join([
-            f'  - {field.human_name}\n      {error_message}'
-            for field, error_message in error_by_field
+            *(f'  - {message}' for message in self.messages),
+            *(
+                f'  - {human_name}\n      {error_message}'
+                for human_name, error_message in error_by_field
+            ),
         ])
 
 
-def assign(jira: JIRA, key: str, assignee: str):
-    """Assign issue to a person."""
-    rich.print(f'Assigning {key} to {assignee}...')
-    jira.assign_issue(
-        issue=key,
-        assignee=assignee,
+@dataclass
+class BulkUpdateFailed(DocumentedError):
+    """
+    Cannot update {self.failed_count} of {self.total_count} JIRA issues 🙁.
+
+    {self.formatted_failures}
+    """
+
+    failures: Dict[str, JIRAUpdateFailed]
+    total_count: int
+
+    @property
+    def failed_count(self) -> int:
+        """Number of issues that were not updated."""
+        return len(self.failures)
+
+    @property
+    def formatted_failures(self) -> str:
+        """Format errors of every issue."""
+        return '\n'.join(
+            f'{issue_key}:\n{failure.formatted_errors}'
+            for issue_key, failure in self.failures.items()
+        )
+
+
+def user_payload(jira: JIRA, user_id: str) -> Dict[str, str]:
+    """Construct the value of a user field, like `assignee`, from user ID."""
+    if jira._is_cloud:  # noqa: WPS437
+        return {'accountId': user_id}
+
+    return {'name': user_id}
+
+
+def assignee_payload(
+    context: JeevesJiraContext,
+    assignee: str,
+) -> Dict[str, str]:
+    """
+    Find a user and construct the value of `assignee` issue field.
+
+    The user is looked up in the cached user directory, not on JIRA.
+    """
+    return user_payload(
+        jira=context.obj.jira,
+        user_id=context.obj.find_user(assignee).user_id,
     )
 
-    rich.print('Assigned!')
 
+async def update_issues(
+    jira: AsyncJira,
+    issue_keys: List[str],
+    issue_fields: Dict[str, Any],
+    on_update: Callable[[], None],
+) -> Dict[str, Exception]:
+    """Update issues concurrently; return errors by issue key."""
+    async def update_issue(  # noqa: WPS430
+        issue_key: str,
+    ) -> Optional[Exception]:
+        try:
+            await jira.put(f'issue/{issue_key}', body={'fields': issue_fields})
+        except (JIRAError, RequestException) as err:
+            return err
+        finally:
+            on_update()
+
+        return None
 
-def update(
+    errors = await asyncio.gather(*map(update_issue, issue_keys))
+
+    return {
+        issue_key: error
+        for issue_key, error in zip(issue_keys, errors)
+        if error is not None
+    }
+
+
+def bulk_update(  # noqa: WPS210
+    context: JeevesJiraContext,
+    where: List[str],
+    issue_fields: Dict[str, Any],
+    dry_run: bool,
+    concurrency: int,
+):
+    """Apply the same field values to all issues matching the filters."""
+    fields = context.obj.fields
+    issue_keys = [
+        issue.key
+        for issue in find_issues_where(
+            context=context,
+            where=where,
+            human_names=['summary'],
+        )
+    ]
+
+    if dry_run:
+        for issue_key in issue_keys:
+            rich.print(f'  * {issue_key}')
+        return
+
+    with Progress() as progress:
+        task = progress.add_task('Updating...', total=len(issue_keys))
+        errors = run_async(
+            client=context.obj.jira,
+            concurrency=concurrency,
+            operation=lambda jira: update_issues(
+                jira=jira,
+                issue_keys=issue_keys,
+                issue_fields=issue_fields,
+                on_update=lambda: progress.advance(task),
+            ),
+        )
+
+    if errors:
+        raise BulkUpdateFailed(
+            failures={
+                issue_key: JIRAUpdateFailed.from_error(error, fields=fields)
+                for issue_key, error in errors.items()
+            },
+            total_count=len(issue_keys),
+        )
+
+    rich.print('Updated!')
+
+
+def transition_with_fields(
+    context: JeevesJiraContext,
+    destination_status: str,
+    issue_fields: Dict[str, Any],
+) -> None:
+    """Move the selected issue to a status, setting its fields on the way."""
+    issue = context.obj.current_issue
+
+    if is_status(issue.fields.status.name, destination_status):
+        if issue_fields:
+            update_issue(
+                client=context.obj.jira,
+                issue_key=issue.key,
+                issue_fields=issue_fields,
+            )
+        return
+
+    workflow = context.obj.workflow_cache.workflow(
+        project=issue.fields.project.key,
+        issue_type=issue.fields.issuetype.name,
+    )
+
+    try:
+        learn_workflow(
+            jira=context.obj.jira,
+            workflow=workflow,
+            issue=issue,
+            destination_statuses=[destination_status],
+        )
+        transition_to_status(
+            jira=context.obj.jira,
+            workflow=workflow,
+            issue_key=issue.key,
+            source_status=issue.fields.status.name,
+            destination_status=destination_status,
+            issue_fields=issue_fields,
+        )
+    finally:
+        context.obj.store_workflow_cache()
+
+
+def update(  # noqa: WPS211
     context: JeevesJiraContext,
     assignee: Optional[str] = default_options.ASSIGNEE,
+    where: Optional[List[str]] = Option(  # noqa: WPS404, B008
+        None,
+        help=(
+            'Instead of the selected issue, update all issues matching '
+            '`field=expression` filter, like `--where version=1.0`. '
+            'May be repeated.'
+        ),
+    ),
+    dry_run: bool = Option(
+        False,
+        '--dry-run',
+        help='With `--where`, only list issues which would be updated.',
+    ),
+    concurrency: int = default_options.CONCURRENCY,
+    status: Optional[str] = Option(
+        None,
+        help=(
+            'Move the selected issue to this status; other changes are sent '
+            'along with the transition.'
+        ),
+    ),
     **options: str,
 ):
     """
     Update the selected JIRA issue.
 
-    Use `jj jump` to select the issue to update.
+    Use `jj jump` to select the issue to update, or `--where` to update many.
     """
+    if where and status is not None:
+        raise BadParameter(
+            'Use `jj status --where` to move many issues to a status.',
+            param_hint='--status',
+        )
+
+    if dry_run and not where:
+        raise BadParameter(
+            'Only updates of many issues, with `--where`, can be dry run.',
+            param_hint='--dry-run',
+        )
+
     fields_and_values = context.obj.fields.match_options(options)
 
     rich.print('Updating:')
@@ -73,19 +311,52 @@ def update(
         for store_field, human_value in fields_and_values
     ])
 
+    if assignee is not None:
+        user = context.obj.find_user(assignee)
+        rich.print(f'  - assignee ≔ {user}')
+        issue_fields['assignee'] = user_payload(
+            jira=context.obj.jira,
+            user_id=user.user_id,
+        )
+
+    if status is not None:
+        rich.print(f'  - status ≔ {status}')
+
+    if where:
+        bulk_update(
+            context=context,
+            where=where,
+            issue_fields=issue_fields,
+            dry_run=dry_run,
+            concurrency=concurrency,
+        )
+        return
+
+    jira = context.obj.jira
+
     try:
-        context.obj.current_issue.update(issue_fields)
+        if status is None:
+            # No need to download the issue to know its key.
+            issue_key = context.obj.cache.selected_issue_key
+            if not issue_key:
+                raise NoIssueSelected()
+
+            if issue_fields:
+                update_issue(
+                    client=jira,
+                    issue_key=issue_key,
+                    issue_fields=issue_fields,
+                )
+        else:
+            transition_with_fields(
+                context=context,
+                destination_status=status,
+                issue_fields=issue_fields,
+            )
     except JIRAError as err:
-        raise JIRAUpdateFailed(
-            errors=err.response.json().get('errors', {}),
+        raise JIRAUpdateFailed.from_error(
+            err,
             fields=context.obj.fields,
         ) from err
 
-    if assignee is not None:
-        assign(
-            jira=context.obj.jira,
-            key=context.obj.current_issue.key,
-            assignee=assignee,
-        )
-
     rich.print('Updated!')
@@ -0,0 +1,37 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from typing import Callable, Iterable, List, TypeVar
+
+ArgumentType = TypeVar('ArgumentType')
+ResultType = TypeVar('ResultType')
+
+
+def map_concurrently(
+    function: Callable[[ArgumentType], ResultType],
+    arguments: Iterable[ArgumentType],
+    concurrency: int,
+    logger: Logger,
+) -> List[ResultType]:
+    """
+    Call the function for every argument in a bounded pool of threads.
+
+    Results are returned in the order of arguments, regardless of the order
+    the calls finish in. Duration of every call is logged.
+    """
+    # Unwrap `functools.partial` to get a readable name.
+    function_name = getattr(function, 'func', function).__name__
+
+    def timed(argument: ArgumentType) -> ResultType:  # noqa: WPS430
+        started_at = time.monotonic()
+        call_result = function(argument)
+        logger.info(
+            '%s(%s) took %.2fs.',
+            function_name,
+            argument,
+            time.monotonic() - started_at,
+        )
+        return call_result
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(timed, arguments))
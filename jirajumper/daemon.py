@@ -0,0 +1,309 @@
+"""
+Serve jirajumper commands over a Unix socket.
+
+Messages are JSON-RPC 2.0, one per line. `jj` sends a `run` request with its
+arguments, working directory and environment; the daemon streams `output`
+notifications with what the command prints, and responds with the exit code.
+"""
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from io import TextIOBase
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+import rich
+from click import Command, _bashcomplete  # noqa: WPS450
+from documented import DocumentedError
+from typer.main import get_command
+
+from jirajumper.cache.cache import WarmOptions
+from jirajumper.cli import app, exception_handler
+from jirajumper.entrypoint import find_subcommand, is_forwarded_env
+
+# Commands run by a daemon started with other credentials would act on
+# behalf of someone else.
+CREDENTIALS_ENV = ('JIRA_SERVER', 'JIRA_USERNAME', 'JIRA_TOKEN')
+
+# Set by shell completion scripts of `jj`.
+COMPLETE_ENV = '_JJ_COMPLETE'
+
+# The daemon refuses to run the command; `jj` runs it on its own.
+REFUSED = -32000
+
+Message = Dict[str, Any]
+
+
+@dataclass
+class DaemonAlreadyRunning(DocumentedError):
+    """
+    jj daemon is already running.
+
+    It listens on {self.socket_path}.
+    """
+
+    socket_path: Path
+
+
+def send_message(stream: BinaryIO, lock: threading.Lock, message: Message):
+    """Write a JSON-RPC message as one line."""
+    with lock:
+        stream.write(json.dumps({'jsonrpc': '2.0', **message}).encode())
+        stream.write(b'\n')
+        stream.flush()
+
+
+class ForwardedOutput(TextIOBase):
+    """Send whatever a command prints to the `jj` process that called it."""
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        lock: threading.Lock,
+        name: str,
+        is_tty: bool,
+    ):
+        """Forward output to a client stream: `stdout` or `stderr`."""
+        super().__init__()
+        self.stream = stream
+        self.lock = lock
+        self.name = name
+        self.is_tty = is_tty
+
+    def writable(self) -> bool:
+        """Output can be written."""
+        return True
+
+    def isatty(self) -> bool:
+        """Pretend to be the terminal of the client, if it has one."""
+        return self.is_tty
+
+    def write(self, text: str) -> int:
+        """Forward a piece of output."""
+        # Progress bars print from their own threads.
+        send_message(self.stream, self.lock, {
+            'method': 'output',
+            'params': {'stream': self.name, 'text': text},
+        })
+        return len(text)
+
+
+@contextmanager
+def forwarded_environment(env: Dict[str, str]) -> Iterator[None]:
+    """Apply the environment of the client while a command runs."""
+    names = set(filter(is_forwarded_env, {*os.environ, *env}))
+    original_env = {env_name: os.environ.get(env_name) for env_name in names}
+
+    def apply(new_env: Dict[str, Optional[str]]):  # noqa: WPS430
+        for env_name in names:
+            env_value = new_env.get(env_name)
+            if env_value is None:
+                os.environ.pop(env_name, None)
+            else:
+                os.environ[env_name] = env_value
+
+    apply(env)
+    try:
+        yield
+    finally:
+        apply(original_env)
+
+
+@contextmanager
+def working_directory(cwd: str) -> Iterator[None]:
+    """Resolve relative paths the way the client would."""
+    original_cwd = os.getcwd()
+    os.chdir(cwd)
+    try:
+        yield
+    finally:
+        os.chdir(original_cwd)
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Run commands one by one, keeping jirajumper state warm between them."""
+
+    command: Command
+    warm_options: WarmOptions
+
+    def __init__(self, socket_path: Path):
+        """Listen on the socket."""
+        super().__init__(str(socket_path), CommandHandler)
+        self.command = get_command(app)
+        self.warm_options = WarmOptions()
+
+    def refusal(self, argv: List[str], env: Dict[str, str]) -> Optional[str]:
+        """Explain why the client should not be served, if it should not."""
+        # Stopping the daemon from inside the daemon would wait forever.
+        if find_subcommand(argv) == 'daemon':
+            return 'jj daemon does not manage itself.'
+
+        for env_name in CREDENTIALS_ENV:
+            if env.get(env_name) != os.getenv(env_name):
+                return f'{env_name} differs from that of the daemon.'
+
+        return None
+
+    def run_command(
+        self,
+        argv: List[str],
+        stdout: ForwardedOutput,
+        stderr: ForwardedOutput,
+    ) -> int:
+        """Run a command like `jj` would, and return its exit code."""
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            # Detect color support and width of the client terminal.
+            rich.reconfigure()
+
+            try:
+                complete_instruction = os.getenv(COMPLETE_ENV)
+                if complete_instruction:
+                    return self.complete(complete_instruction)
+
+                self.command.main(
+                    args=argv,
+                    prog_name='jj',
+                    obj=self.warm_options,
+                )
+            except SystemExit as exit_error:
+                return exit_code(exit_error.code)
+            except Exception as error:
+                if logging.getLogger('jj').level == logging.DEBUG:
+                    rich.get_console().print_exception()
+                else:
+                    exception_handler(type(error), error, None)
+
+                return 1
+
+        return 0
+
+    def complete(self, complete_instruction: str) -> int:
+        """
+        Print shell completion choices.
+
+        `Command.main()` would do that too, but then it would terminate the
+        process by `os._exit()`. Exit code is the one Click would use.
+        """
+        _bashcomplete.bashcomplete(
+            self.command,
+            'jj',
+            COMPLETE_ENV,
+            complete_instruction,
+        )
+        return 1
+
+
+def exit_code(code: Any) -> int:
+    """Convert `SystemExit.code` to the process exit code."""
+    if code is None:
+        return 0
+
+    if isinstance(code, int):
+        return code
+
+    sys.stderr.write(f'{code}\n')
+    return 1
+
+
+class CommandHandler(socketserver.StreamRequestHandler):
+    """Handle one request of a `jj` client."""
+
+    server: DaemonServer
+
+    def handle(self):
+        """Read the request, run it and respond."""
+        lock = threading.Lock()
+        line = self.rfile.readline()
+
+        # Somebody has only checked that the daemon is listening.
+        if not line:
+            return
+
+        request = json.loads(line)
+
+        if request['method'] == 'shutdown':
+            send_message(self.wfile, lock, {
+                'id': request['id'],
+                'result': {'exit_code': 0},
+            })
+            threading.Thread(target=self.server.shutdown).start()
+            return
+
+        params = request['params']
+        refusal = self.server.refusal(params['argv'], params['env'])
+        if refusal is not None:
+            send_message(self.wfile, lock, {
+                'id': request['id'],
+                'error': {'code': REFUSED, 'message': refusal},
+            })
+            return
+
+        with forwarded_environment(params['env']):
+            with working_directory(params['cwd']):
+                code = self.server.run_command(
+                    argv=params['argv'],
+                    stdout=ForwardedOutput(
+                        self.wfile, lock, 'stdout', params['is_tty'],
+                    ),
+                    stderr=ForwardedOutput(
+                        self.wfile, lock, 'stderr', params['is_tty'],
+                    ),
+                )
+
+        send_message(self.wfile, lock, {
+            'id': request['id'],
+            'result': {'exit_code': code},
+        })
+
+
+def is_listening(socket_path: Path) -> bool:
+    """Find out if a daemon accepts connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(socket_path))
+        except OSError:
+            return False
+
+    return True
+
+
+def request_shutdown(socket_path: Path) -> bool:
+    """Ask the daemon to stop; return `False` if it is not running."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(socket_path))
+        except OSError:
+            return False
+
+        with connection.makefile('rwb') as stream:
+            send_message(stream, threading.Lock(), {
+                'id': 1,
+                'method': 'shutdown',
+            })
+            stream.readline()
+
+    return True
+
+
+def serve(socket_path: Path) -> None:
+    """Serve commands until asked to stop."""
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if is_listening(socket_path):
+        raise DaemonAlreadyRunning(socket_path=socket_path)
+
+    # Left over by a daemon that has not stopped cleanly.
+    if socket_path.exists():
+        socket_path.unlink()
+
+    with DaemonServer(socket_path) as server:
+        try:
+            server.serve_forever()
+        finally:
+            socket_path.unlink()
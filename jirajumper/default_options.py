@@ -5,6 +5,12 @@ ASSIGNEE = Option(
     help='Assignee display name or email address. Supports fuzzy search.',
 )
 
+CONCURRENCY = Option(
+    4,
+    min=1,
+    help='Maximum number of requests to JIRA sent at the same time.',
+)
+
 SUMMARY = Argument(
     ...,
     help='Issue summary.'
@@ -0,0 +1,167 @@
+"""
+`jj` executable.
+
+If `jj daemon` is running, the command is forwarded to it, and the daemon
+runs the command with everything already imported and configured. Otherwise,
+the command runs in this process as usual.
+
+Only the standard library is imported here: importing the rest of jirajumper
+takes longer than the daemon needs to run a typical command.
+"""
+import json
+import os
+import shutil
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_CACHE_PATH = Path.home() / '.cache/jirajumper/jirajumper.json'
+
+# The daemon compares credentials with its own and applies the rest.
+FORWARDED_ENV_PREFIXES = ('JIRA_', 'JIRAJUMPER_', '_JJ_', '_TYPER_')
+FORWARDED_ENV = (
+    'TERM',
+    'COLORTERM',
+    'NO_COLOR',
+    'FORCE_COLOR',
+    'COLUMNS',
+    'LINES',
+    'COMP_WORDS',
+    'COMP_CWORD',
+)
+
+# Options of `jj` itself which take a value, like `--format json`.
+GLOBAL_OPTIONS_WITH_VALUE = (
+    '--format',
+    '--cache-path',
+    '--cache-ttl',
+    '--log-level',
+)
+
+
+def daemon_socket_path(cache_path: Path) -> Path:
+    """Path to the Unix socket of the daemon serving this cache."""
+    return cache_path.with_name('daemon.sock')
+
+
+def env_cache_path() -> Path:
+    """Path to jirajumper cache, as `jj` will see it if not told otherwise."""
+    return Path(os.getenv('JIRAJUMPER_CACHE_PATH') or DEFAULT_CACHE_PATH)
+
+
+def is_forwarded_env(env_name: str) -> bool:
+    """Find out if the daemon needs an environment variable."""
+    return (
+        env_name.startswith(FORWARDED_ENV_PREFIXES) or
+        env_name in FORWARDED_ENV
+    )
+
+
+def forwarded_env() -> Dict[str, str]:
+    """Environment variables the daemon needs to run the command as we would."""
+    env = {
+        env_name: env_value
+        for env_name, env_value in os.environ.items()
+        if is_forwarded_env(env_name)
+    }
+
+    terminal_size = shutil.get_terminal_size()
+    env['COLUMNS'] = str(terminal_size.columns)
+    env['LINES'] = str(terminal_size.lines)
+
+    return env
+
+
+def find_subcommand(argv: List[str]) -> Optional[str]:
+    """Find the subcommand `jj` is invoked with, skipping global options."""
+    arguments = iter(argv)
+    for argument in arguments:
+        if argument in GLOBAL_OPTIONS_WITH_VALUE:
+            next(arguments, None)
+        elif not argument.startswith('-'):
+            return argument
+
+    return None
+
+
+def is_forwardable(argv: List[str]) -> bool:
+    """
+    Find out if the command may be run by the daemon.
+
+    The daemon has no access to our standard input, and it does not manage
+    itself.
+    """
+    if os.getenv('JIRAJUMPER_NO_DAEMON'):
+        return False
+
+    if find_subcommand(argv) == 'daemon':
+        return False
+
+    return '-' not in argv
+
+
+def forward(argv: List[str], socket_path: Path) -> Optional[int]:
+    """
+    Run the command by the daemon, printing what it prints.
+
+    Return the exit code, or `None` if the daemon is not available or refused
+    to run the command, so that it should run in this process.
+    """
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        connection.connect(str(socket_path))
+    except OSError:
+        connection.close()
+        return None
+
+    request = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'run',
+        'params': {
+            'argv': argv,
+            'cwd': os.getcwd(),
+            'env': forwarded_env(),
+            'is_tty': sys.stdout.isatty(),
+        },
+    }
+
+    with connection, connection.makefile('rwb') as stream:
+        stream.write(json.dumps(request).encode() + b'\n')
+        stream.flush()
+
+        for line in stream:
+            message: Dict[str, Any] = json.loads(line)
+
+            if message.get('method') == 'output':
+                output = getattr(sys, message['params']['stream'])
+                output.write(message['params']['text'])
+                output.flush()
+
+            elif 'result' in message:
+                return message['result']['exit_code']
+
+            else:
+                return None
+
+    # The command may have been partially done; it is not safe to rerun it.
+    sys.stderr.write('jj daemon disconnected before the command finished.\n')
+    return 1
+
+
+def main() -> None:
+    """Run `jj`, by the daemon if possible."""
+    argv = sys.argv[1:]
+
+    if is_forwardable(argv):
+        exit_code = forward(
+            argv=argv,
+            socket_path=daemon_socket_path(env_cache_path()),
+        )
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from jirajumper.cli import app  # noqa: WPS433
+    app(prog_name='jj')
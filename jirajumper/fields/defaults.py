@@ -1,5 +1,6 @@
 """A few default JIRA fields with their definitions and formats."""
 import operator
+from typing import List
 
 from jirajumper.fields.field import JiraField
 from jirajumper.fields.repository import JiraFieldsRepository
@@ -8,6 +9,24 @@ from jirajumper.models import FieldByName
 get_name = operator.attrgetter('name')
 
 
+def user_identifiers(user) -> List[str]:
+    """List username, account ID, email and display name of a user."""
+    if not user:
+        return []
+
+    return [
+        getattr(user, attribute_name)
+        for attribute_name in (
+            'name',
+            'key',
+            'accountId',
+            'emailAddress',
+            'displayName',
+        )
+        if getattr(user, attribute_name, None)
+    ]
+
+
 VERSION = JiraField(
     jira_name='fixVersions',
     jql_name='fixVersion',
@@ -88,6 +107,7 @@ ASSIGNEE = JiraField(
     human_name='assignee',
     description='Person the issue is assigned to.',
     from_jira=lambda assignee: assignee and assignee.displayName,
+    identifiers=user_identifiers,
     to_jira=NotImplemented,
     is_mutable=False,
 )
@@ -1,7 +1,7 @@
 import operator
 import re
-from dataclasses import asdict, dataclass
-from typing import Optional, Protocol, Tuple, TypeVar, Union
+from dataclasses import dataclass
+from typing import List, Optional, Protocol, Tuple, TypeVar, Union
 
 from jira import Issue
 
@@ -32,6 +32,14 @@ class FromJira(Protocol):
         raise NotImplementedError()
 
 
+class Identifiers(Protocol):
+    """List strings by which JQL finds a native JIRA field value."""
+
+    def __call__(self, jira_value: JiraValue) -> List[str]:
+        """List strings by which JQL finds a native JIRA field value."""
+        raise NotImplementedError()
+
+
 class ToJQL(Protocol):
     """Construct a JQL expression from a raw argument value."""
 
@@ -59,6 +67,9 @@ class JiraField:
     to_jira: Union[ToJira, NotImplementedType] = identity
     from_jira: FromJira = identity
 
+    # JQL may find a value by something else than its readable form.
+    identifiers: Optional[Identifiers] = None
+
     def retrieve(self, issue: Issue):
         """Retrieve the native field value from given issue."""
         return self.from_jira(
@@ -88,8 +99,9 @@ class JiraField:
                 f'`{self.jira_name}` is not a valid JIRA field name.',
             )
 
+        # Not `asdict()`: it would deep copy every attribute.
         field_dict = {
-            **asdict(self),
+            **vars(self),
             **{
                 'unresolved_jira_name': unresolved_name,
                 'jira_name': resolved_name,
@@ -112,21 +124,44 @@ def _jql_operator(is_multiple: bool, is_positive: bool) -> str:
     }[is_multiple][is_positive]
 
 
+def parse_expression(expression: str) -> Tuple[bool, List[str]]:
+    """Split `-value1,value2` into negation flag and list of values."""
+    minus, pattern = re.match('(-*)(.+)', expression).groups()
+
+    return not minus, list(map(
+        str.strip,
+        pattern.split(','),
+    ))
+
+
 @dataclass(frozen=True)
 class ResolvedField(JiraField):
     """JIRA field description with resolved field name."""
 
     unresolved_jira_name: Optional[str] = None
 
+    def matches(self, issue: Issue, expression: str) -> bool:
+        """Check the issue against an expression, as `to_jql()` would."""
+        is_positive, search_values = parse_expression(expression)
+
+        if self.identifiers is None:
+            identifiers = [str(self.retrieve(issue=issue))]
+        else:
+            identifiers = self.identifiers(
+                operator.attrgetter(self.jira_name)(issue.fields),
+            )
+
+        known_values = {identifier.lower() for identifier in identifiers}
+        is_found = any(
+            search_value.lower() in known_values
+            for search_value in search_values
+        )
+
+        return is_found == is_positive
+
     def to_jql(self, expression: str) -> str:   # noqa: WPS210
         """Convert human readable expression to JQL."""
-        minus, pattern = re.match('(-*)(.+)', expression).groups()
-        is_positive = not minus
-
-        search_values = list(map(
-            str.strip,
-            pattern.split(','),
-        ))
+        is_positive, search_values = parse_expression(expression)
         is_multiple = len(search_values) > 1
 
         jql_operator = _jql_operator(
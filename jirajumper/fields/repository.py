@@ -1,35 +1,106 @@
-from typing import Dict, List, Optional, Tuple
-
-from more_itertools import first
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 from jirajumper.fields.field import JiraField
 
 
-class JiraFieldsRepository(List[JiraField]):
-    """List of supported JIRA issue fields."""
+def _index(
+    fields: Iterable[JiraField],
+    names: Iterable[Optional[str]],
+) -> Mapping[str, JiraField]:
+    """Map names to fields; the first field with a name wins."""
+    field_by_name: Dict[str, JiraField] = {}
+    for field, name in zip(fields, names):
+        if name is not None:
+            field_by_name.setdefault(name, field)
+
+    return MappingProxyType(field_by_name)
+
+
+class JiraFieldsRepository(Tuple[JiraField, ...]):
+    """
+    Supported JIRA issue fields.
+
+    The repository is immutable; fields are indexed by name on first lookup,
+    and filtered views are computed once.
+    """
+
+    @cached_property
+    def by_human_name(self) -> Mapping[str, JiraField]:
+        """Fields by human readable name."""
+        return _index(self, (field.human_name for field in self))
+
+    @cached_property
+    def by_jira_name(self) -> Mapping[str, JiraField]:
+        """Fields by JIRA name, resolved if the fields have been resolved."""
+        return _index(self, (
+            field.jira_name if isinstance(field.jira_name, str) else None
+            for field in self
+        ))
+
+    @cached_property
+    def by_unresolved_jira_name(self) -> Mapping[str, JiraField]:
+        """Resolved fields by JIRA name as configured, like `Epic Link`."""
+        return _index(self, (
+            getattr(field, 'unresolved_jira_name', None)
+            for field in self
+        ))
+
+    @cached_property
+    def _position_by_human_name(self) -> Mapping[str, int]:
+        position_by_human_name: Dict[str, int] = {}
+        for position, field in enumerate(self):
+            position_by_human_name.setdefault(field.human_name, position)
+
+        return MappingProxyType(position_by_human_name)
 
     def find_by_jira_name(self, jira_name: str) -> Optional[JiraField]:
         """Find a field by JIRA name."""
-        return first(
-            filter(
-                lambda field: field.jira_name == jira_name,
-                self,
-            ), None,
+        return self.by_jira_name.get(jira_name)
+
+    def find_by_unresolved_jira_name(
+        self,
+        unresolved_jira_name: str,
+    ) -> Optional[JiraField]:
+        """Find a resolved field by its JIRA name as configured."""
+        return self.by_unresolved_jira_name.get(unresolved_jira_name)
+
+    def find_by_human_name(self, human_name: str) -> Optional[JiraField]:
+        """Find a field by its human readable name."""
+        return self.by_human_name.get(human_name)
+
+    def search_fields(self, human_names: Iterable[str]) -> List[str]:
+        """
+        List JIRA fields a search must return to retrieve the given fields.
+
+        Nested fields, like `status.statusCategory`, are requested by the name
+        of their top level field.
+        """
+        return sorted({
+            self.by_human_name[human_name].jira_name.split('.')[0]
+            for human_name in human_names
+        })
+
+    @cached_property
+    def _writable(self) -> 'JiraFieldsRepository':
+        return JiraFieldsRepository(filter(JiraField.is_writable, self))
+
+    @cached_property
+    def _mutable(self) -> 'JiraFieldsRepository':
+        return JiraFieldsRepository(
+            field
+            for field in self
+            if field.is_writable() and field.is_mutable
         )
 
     def writable(self) -> 'JiraFieldsRepository':
         """Show only fields that are writable."""
-        return JiraFieldsRepository(filter(
-            JiraField.is_writable,
-            self,
-        ))
+        return self._writable
 
     def mutable(self) -> 'JiraFieldsRepository':
         """Show only fields that are mutable."""
-        return JiraFieldsRepository(filter(
-            lambda field: field.is_writable and field.is_mutable,
-            self,
-        ))
+        return self._mutable
 
     def match_options(
         self,
@@ -39,10 +110,18 @@ class JiraFieldsRepository(List[JiraField]):
         Match fields in the repo with CLI options provided by the user.
 
         Returns a list of `(JiraField, str)` pairs, where `str` is the value
-        assigned to this field by the user.
+        assigned to this field by the user, in the order of fields.
         """
+        matched_names = sorted(
+            (
+                human_name
+                for human_name, human_value in options.items()
+                if human_value and human_name in self.by_human_name
+            ),
+            key=self._position_by_human_name.__getitem__,
+        )
+
         return [
-            (field, options[field.human_name])
-            for field in self
-            if options.get(field.human_name)
+            (self.by_human_name[human_name], options[human_name])
+            for human_name in matched_names
         ]
@@ -0,0 +1,12 @@
+import pytest
+
+from jirajumper.fields import FIELDS, JiraFieldsRepository
+
+
+@pytest.fixture()
+def resolved_fields() -> JiraFieldsRepository:
+    """Default fields, resolved as if `Epic Link` were `customfield_10008`."""
+    return JiraFieldsRepository(
+        field.resolve(field_key_by_name={'Epic Link': 'customfield_10008'})
+        for field in FIELDS
+    )
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+import time
+
+from jirajumper.async_client import AsyncJira, run_async
+
+
+class FakeResponse:
+    content = b'{}'
+
+    def __init__(self, url):
+        self.url = url
+
+    def json(self):
+        return {'url': self.url}
+
+
+class FakeSession:
+    """Records the highest number of requests in flight."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def put(self, url, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.in_flight, self.max_in_flight)
+
+        time.sleep(0.01)
+
+        with self.lock:
+            self.in_flight -= 1
+
+        return FakeResponse(url)
+
+
+class FakeJira:
+    def __init__(self):
+        self._session = FakeSession()
+
+    def _get_url(self, path):
+        return f'https://example.com/rest/api/2/{path}'
+
+
+async def update_many(jira: AsyncJira):
+    return await asyncio.gather(*(
+        jira.put(f'issue/PROJ-{number}', body={'fields': {}})
+        for number in range(10)
+    ))
+
+
+def test_bounded_concurrency():
+    client = FakeJira()
+
+    responses = run_async(client, concurrency=3, operation=update_many)
+
+    assert [response['url'][-7:] for response in responses] == [
+        f'/PROJ-{number}' for number in range(10)
+    ]
+    assert client._session.max_in_flight == 3
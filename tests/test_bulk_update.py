@@ -0,0 +1,75 @@
+import json
+
+import pytest
+import requests
+from jira import JIRAError
+from typer import BadParameter
+
+from jirajumper.commands.list_issues import parse_where
+from jirajumper.commands.update import BulkUpdateFailed, JIRAUpdateFailed
+from jirajumper.fields import FIELDS
+
+
+def test_parse_where():
+    assert parse_where(['version=1.0', 'status-category=-Done'], FIELDS) == {
+        'version': '1.0',
+        'status_category': '-Done',
+    }
+
+
+@pytest.mark.parametrize('where_filter', ['version', 'version=', 'foo=bar'])
+def test_parse_where_invalid(where_filter):
+    with pytest.raises(BadParameter):
+        parse_where([where_filter], FIELDS)
+
+
+def test_bulk_update_failed():
+    error = BulkUpdateFailed(
+        failures={
+            'PROJ-1': JIRAUpdateFailed(
+                errors={'fixVersions': 'Version 9.0 does not exist.'},
+                fields=FIELDS,
+            ),
+        },
+        total_count=3,
+    )
+
+    assert str(error).splitlines()[:4] == [
+        'Cannot update 1 of 3 JIRA issues 🙁.',
+        '',
+        'PROJ-1:',
+        '  - version',
+    ]
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.text = body
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def test_update_failed_from_error():
+    forbidden = JIRAError(
+        status_code=403,
+        response=FakeResponse(json.dumps({
+            'errorMessages': ['You do not have the permission.'],
+            'errors': {},
+        })),
+    )
+    assert JIRAUpdateFailed.from_error(forbidden, fields=FIELDS).messages == [
+        'You do not have the permission.',
+    ]
+
+    proxy_error = JIRAError(
+        status_code=502,
+        response=FakeResponse('Bad Gateway'),
+    )
+    assert JIRAUpdateFailed.from_error(proxy_error, fields=FIELDS).messages == [
+        'Bad Gateway',
+    ]
+
+    disconnected = requests.ConnectionError('Connection refused')
+    failure = JIRAUpdateFailed.from_error(disconnected, fields=FIELDS)
+    assert failure.messages == ['Connection refused']
@@ -0,0 +1,22 @@
+import pytest
+
+from jirajumper.client import jira
+
+
+@pytest.fixture()
+def credentials(monkeypatch):
+    monkeypatch.setenv('JIRA_SERVER', 'https://example.atlassian.net/')
+    monkeypatch.setenv('JIRA_USERNAME', 'user@example.com')
+    monkeypatch.setenv('JIRA_TOKEN', 'token')
+    jira.cache_clear()
+    yield
+    jira.cache_clear()
+
+
+@pytest.mark.usefixtures('credentials')
+def test_single_client():
+    """The client is constructed once and without contacting the server."""
+    client = jira()
+
+    assert jira() is client
+    assert client.server_url == 'https://example.atlassian.net'
@@ -0,0 +1,32 @@
+import io
+
+import pytest
+from typer import BadParameter
+
+from jirajumper.commands.clone import read_issue_rows
+from jirajumper.fields import FIELDS
+
+
+def test_read_csv():
+    source = io.StringIO('summary,assignee\nFirst,\n"Second, too",alice\n')
+
+    assert read_issue_rows(source, FIELDS) == [
+        {'summary': 'First', 'assignee': ''},
+        {'summary': 'Second, too', 'assignee': 'alice'},
+    ]
+
+
+def test_read_json_lines():
+    source = io.StringIO(
+        '{"summary": "First", "type": "Bug"}\n\n{"summary": "Second"}\n',
+    )
+
+    assert read_issue_rows(source, FIELDS) == [
+        {'summary': 'First', 'type': 'Bug'},
+        {'summary': 'Second'},
+    ]
+
+
+def test_unknown_column():
+    with pytest.raises(BadParameter):
+        read_issue_rows(io.StringIO('summry\nFirst\n'), FIELDS)
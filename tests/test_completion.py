@@ -0,0 +1,56 @@
+import click
+
+from jirajumper.cache.completion import (
+    CompletionIndex,
+    complete_issue_key,
+    completion_index_path,
+    field_completion,
+    most_recent_first,
+)
+from jirajumper.client import issue_from_raw
+
+SERVER = 'https://jira.example.com'
+
+
+def make_issue(key: str, status: str, epic=None):
+    return issue_from_raw(
+        {
+            'key': key,
+            'fields': {
+                'status': {'name': status},
+                'issuetype': {'name': 'Task'},
+                'customfield_10008': epic,
+            },
+        },
+        server=SERVER,
+    )
+
+
+def test_most_recent_first():
+    assert most_recent_first(['a', 'b', 'c'], ['c', 'd', 'c'], limit=3) == [
+        'c', 'd', 'a',
+    ]
+
+
+def test_complete_from_index(tmp_path, resolved_fields):
+    index = CompletionIndex()
+    index.remember_issues(
+        [
+            make_issue('PROJ-1', 'Open'),
+            make_issue('PROJ-12', 'In Progress', epic='PROJ-100'),
+            make_issue('OTHER-3', 'Open'),
+        ],
+        fields=resolved_fields,
+    )
+
+    cache_path = tmp_path / 'jirajumper.json'
+    completion_index_path(cache_path).write_text(index.json())
+
+    command = click.Command('jj', params=[click.Option(['--cache-path'])])
+    ctx = click.Context(command)
+    ctx.params['cache_path'] = str(cache_path)
+
+    assert complete_issue_key(ctx, 'proj-1') == ['PROJ-1', 'PROJ-12']
+    assert field_completion('status')(ctx, [], '') == ['Open', 'In Progress']
+    assert field_completion('epic')(ctx, [], 'P') == ['PROJ-100']
+    assert field_completion('version')(ctx, [], '') == []
@@ -0,0 +1,18 @@
+import logging
+import time
+
+from jirajumper.concurrency import map_concurrently
+
+
+def slow_square(number: int) -> int:
+    time.sleep(0.01 * (5 - number))
+    return number ** 2
+
+
+def test_order_is_preserved():
+    assert map_concurrently(
+        slow_square,
+        range(5),
+        concurrency=5,
+        logger=logging.getLogger('test'),
+    ) == [0, 1, 4, 9, 16]
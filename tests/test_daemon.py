@@ -0,0 +1,59 @@
+import subprocess  # noqa: S404
+import sys
+import time
+
+import pytest
+
+from jirajumper.daemon import is_listening, request_shutdown
+from jirajumper.entrypoint import daemon_socket_path, forward, is_forwardable
+
+
+@pytest.fixture()
+def socket_path(tmp_path):
+    cache_path = tmp_path / 'jirajumper.json'
+    socket_path = daemon_socket_path(cache_path)
+
+    daemon = subprocess.Popen([  # noqa: S603
+        sys.executable,
+        '-m',
+        'jirajumper',
+        '--cache-path',
+        str(cache_path),
+        'daemon',
+        'serve',
+    ])
+
+    deadline = time.monotonic() + 10
+    while not is_listening(socket_path):
+        assert time.monotonic() < deadline
+        time.sleep(0.1)
+
+    yield socket_path
+
+    request_shutdown(socket_path)
+    daemon.wait(timeout=10)
+
+
+def test_forward_to_daemon(socket_path, capsys):
+    assert forward(['--help'], socket_path) == 0
+    assert 'Manage JIRA issues.' in capsys.readouterr().out
+
+    assert forward(['no-such-command'], socket_path) == 2
+    assert 'No such command' in capsys.readouterr().err
+
+
+def test_daemon_refuses_to_manage_itself(socket_path):
+    assert forward(['--format', 'json', 'daemon', 'stop'], socket_path) is None
+    assert is_listening(socket_path)
+
+
+def test_no_daemon(tmp_path):
+    assert forward(['--help'], tmp_path / 'daemon.sock') is None
+
+
+def test_is_forwardable():
+    assert is_forwardable(['jump', 'PROJ-1'])
+    assert not is_forwardable(['daemon', 'stop'])
+    assert not is_forwardable(['--format', 'json', 'daemon', 'stop'])
+    assert not is_forwardable(['--cache-path=/tmp/jj.json', 'daemon', 'serve'])
+    assert not is_forwardable(['clone', '--from-file', '-'])
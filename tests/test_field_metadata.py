@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+
+from jirajumper.cache.cache import FieldMetadataCache, IssueFieldMetadata
+
+SERVER = 'https://example.atlassian.net'
+
+EPIC_LINK = IssueFieldMetadata.parse_obj({
+    'key': 'customfield_10008',
+    'name': 'Epic Link',
+    'clauseNames': ['cf[10008]', 'Epic Link'],
+    'schema': {'type': 'any', 'custom': 'gh-epic-link'},
+})
+
+
+def field_metadata(age: timedelta) -> FieldMetadataCache:
+    return FieldMetadataCache(
+        server=SERVER,
+        retrieved_at=datetime.now(tz=timezone.utc) - age,
+        issue_fields=[EPIC_LINK],
+    )
+
+
+def test_key_by_name():
+    metadata = field_metadata(age=timedelta(0))
+    assert metadata.key_by_name == {'Epic Link': 'customfield_10008'}
+    assert metadata.key_by_clause_name['cf[10008]'] == 'customfield_10008'
+
+
+def test_is_fresh():
+    ttl = timedelta(hours=24)
+
+    assert field_metadata(age=timedelta(hours=1)).is_fresh(SERVER, ttl)
+    assert not field_metadata(age=timedelta(hours=25)).is_fresh(SERVER, ttl)
+    assert not field_metadata(age=timedelta(0)).is_fresh('https://x', ttl)
+
+
+def test_round_trip():
+    metadata = field_metadata(age=timedelta(0))
+    raw_metadata = metadata.json(by_alias=True)
+    assert FieldMetadataCache.parse_raw(raw_metadata) == metadata
@@ -0,0 +1,62 @@
+from jirajumper.fields import JiraField, JiraFieldsRepository
+from jirajumper.models import FieldByName
+
+
+def test_find_by_names(resolved_fields):
+    epic = resolved_fields.find_by_human_name('epic')
+
+    assert resolved_fields.find_by_jira_name('customfield_10008') is epic
+    assert resolved_fields.find_by_unresolved_jira_name('Epic Link') is epic
+    assert resolved_fields.find_by_jira_name('Epic Link') is None
+    assert resolved_fields.find_by_human_name('nonexistent') is None
+
+
+def test_first_field_wins():
+    first, second = (
+        JiraField(jira_name='summary', human_name='summary', description=name)
+        for name in ('first', 'second')
+    )
+
+    assert JiraFieldsRepository([first, second]).find_by_human_name(
+        'summary',
+    ) is first
+
+
+def test_unresolved_fields_are_not_indexed_by_jira_name():
+    fields = JiraFieldsRepository([
+        JiraField(
+            jira_name=FieldByName('Epic Link'),
+            human_name='epic',
+            description='Epic.',
+        ),
+    ])
+
+    assert not fields.by_jira_name
+    assert not fields.by_unresolved_jira_name
+
+
+def test_mutable_fields_are_writable(resolved_fields):
+
+    assert resolved_fields.mutable()
+    assert all(field.is_writable() for field in resolved_fields.mutable())
+    assert all(field.is_mutable for field in resolved_fields.mutable())
+    assert set(resolved_fields.mutable()) <= set(resolved_fields.writable())
+    assert resolved_fields.writable() is resolved_fields.writable()
+
+
+def test_match_options_in_order_of_fields(resolved_fields):
+    matched = resolved_fields.match_options({
+        'status': 'Done',
+        'summary': 'Hello',
+        'nonexistent': 'value',
+        'epic': '',
+    })
+
+    human_names = [field.human_name for field, _human_value in matched]
+    positions = [
+        resolved_fields.index(field)
+        for field, _human_value in matched
+    ]
+
+    assert sorted(human_names) == ['status', 'summary']
+    assert positions == sorted(positions)
@@ -0,0 +1,145 @@
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+from jirajumper.cache.cache import GlobalOptions, JiraCache, LinkTypesCache
+from jirajumper.client import issue_from_raw, jira
+from jirajumper.commands.fork import fork
+from jirajumper.models import OutputFormat
+
+SERVER = 'https://jira.example.com'
+
+
+CREATED = (201, {'id': '10100', 'key': 'PROJ-2'})
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Answer requests in turn, by default as if an issue has been created."""
+
+    def __init__(self, answers=()):
+        super().__init__()
+        self.requests = []
+        self.answers = list(answers)
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status_code, body = self.answers.pop(0) if self.answers else CREATED
+
+        response = Response()
+        response.status_code = status_code
+        response.url = request.url
+        response.request = request
+        response._content = json.dumps(body).encode()
+        return response
+
+
+@pytest.fixture()
+def global_options(monkeypatch, tmp_path, resolved_fields):
+    monkeypatch.setenv('JIRA_SERVER', SERVER)
+    monkeypatch.setenv('JIRA_USERNAME', 'user@example.com')
+    monkeypatch.setenv('JIRA_TOKEN', 'token')
+    jira.cache_clear()
+
+    options = GlobalOptions(
+        logger=logging.getLogger('jj'),
+        output_format=OutputFormat.PRETTY,
+        cache_path=tmp_path / 'jirajumper.json',
+        cache_ttl=timedelta(hours=1),
+    )
+
+    client = jira()
+    client.deploymentType = 'Server'
+    options.__dict__.update(
+        jira=client,
+        fields=resolved_fields,
+        link_types=LinkTypesCache(
+            server=SERVER,
+            retrieved_at=datetime.now(tz=timezone.utc),
+            link_types=[
+                {
+                    'name': 'Blocks',
+                    'inward': 'is blocked by',
+                    'outward': 'blocks',
+                },
+            ],
+        ),
+        current_issue=issue_from_raw(
+            {
+                'key': 'PROJ-1',
+                'fields': {
+                    'summary': 'Parent',
+                    'assignee': {'name': 'jane', 'displayName': 'Jane'},
+                    'project': {'key': 'PROJ'},
+                    'issuetype': {'name': 'Task'},
+                    'fixVersions': [],
+                    'customfield_10008': None,
+                    'description': None,
+                },
+            },
+            server=SERVER,
+        ),
+    )
+
+    yield options
+    jira.cache_clear()
+
+
+def test_fork_is_one_request(global_options):
+    adapter = RecordingAdapter()
+    global_options.jira._session.mount(SERVER, adapter)
+
+    fork(
+        context=SimpleNamespace(obj=global_options),
+        link_type='is-blocked-by',
+        stay=False,
+        assignee=None,
+        summary='Child',
+    )
+
+    assert len(adapter.requests) == 1
+    payload = json.loads(adapter.requests[0].body)
+    assert payload['fields']['summary'] == 'Child'
+    assert payload['fields']['assignee'] == {'name': 'jane'}
+    assert payload['update']['issuelinks'] == [{
+        'add': {
+            'type': {'name': 'Blocks'},
+            'outwardIssue': {'key': 'PROJ-1'},
+        },
+    }]
+
+    assert global_options.cache_path.exists()
+    stored_cache = JiraCache.parse_raw(global_options.cache_path.read_text())
+    assert stored_cache.selected_issue_key == 'PROJ-2'
+
+
+def test_fork_links_separately_if_create_screen_refuses(global_options):
+    adapter = RecordingAdapter(answers=[
+        (400, {'errors': {'issuelinks': 'Not on the appropriate screen.'}}),
+        CREATED,
+        (201, {}),
+    ])
+    global_options.jira._session.mount(SERVER, adapter)
+
+    fork(
+        context=SimpleNamespace(obj=global_options),
+        link_type='blocks',
+        stay=True,
+        assignee=None,
+        summary='Child',
+    )
+
+    created, recreated, linked = map(json.loads, (
+        sent_request.body for sent_request in adapter.requests
+    ))
+    assert 'issuelinks' in created['update']
+    assert not recreated['update']
+    assert linked == {
+        'type': {'name': 'Blocks'},
+        'inwardIssue': {'key': 'PROJ-1'},
+        'outwardIssue': {'key': 'PROJ-2'},
+    }
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+from jirajumper.cache.issues import IssueResponseCache
+
+SERVER = 'https://jira.example.com'
+RAW_ISSUE = {'key': 'PROJ-1', 'fields': {'updated': '2021-01-01T10:00:00'}}
+
+
+class FakeSession:
+    def __init__(self, etag=None):
+        self.etag = etag
+        self.requests = []
+
+    def get(self, url, headers=None, params=None):
+        self.requests.append((url, headers, params))
+
+        if params:
+            return SimpleNamespace(
+                status_code=200,
+                json=lambda: {
+                    'fields': {'updated': RAW_ISSUE['fields']['updated']},
+                },
+            )
+
+        if self.etag and (headers or {}).get('If-None-Match') == self.etag:
+            return SimpleNamespace(status_code=304, headers={})
+
+        return SimpleNamespace(
+            status_code=200,
+            headers={'ETag': self.etag} if self.etag else {},
+            json=lambda: RAW_ISSUE,
+        )
+
+
+def fake_client(etag=None):
+    return SimpleNamespace(
+        _session=FakeSession(etag=etag),
+        _get_url=lambda path: path,
+    )
+
+
+def test_revalidate_by_etag(tmp_path):
+    issue_cache = IssueResponseCache(path=tmp_path, server=SERVER)
+    client = fake_client(etag='"v1"')
+
+    assert issue_cache.fetch(client, 'PROJ-1') == RAW_ISSUE
+    assert issue_cache.fetch(client, 'proj-1') == RAW_ISSUE
+
+    assert client._session.requests == [
+        ('issue/PROJ-1', {}, None),
+        ('issue/proj-1', {'If-None-Match': '"v1"'}, None),
+    ]
+
+
+def test_revalidate_by_updated(tmp_path):
+    issue_cache = IssueResponseCache(path=tmp_path, server=SERVER)
+    client = fake_client()
+
+    issue_cache.fetch(client, 'PROJ-1')
+    assert issue_cache.fetch(client, 'PROJ-1') == RAW_ISSUE
+
+    assert client._session.requests == [
+        ('issue/PROJ-1', {}, None),
+        ('issue/PROJ-1', None, {'fields': 'updated'}),
+    ]
+
+
+def test_fresh_issue(tmp_path):
+    issue_cache = IssueResponseCache(path=tmp_path, server=SERVER)
+    client = fake_client(etag='"v1"')
+
+    issue_cache.fetch(client, 'PROJ-1')
+    issue_cache.fetch(client, 'PROJ-1', fresh=True)
+
+    assert client._session.requests == [
+        ('issue/PROJ-1', {}, None),
+        ('issue/PROJ-1', {}, None),
+    ]
+
+
+def test_servers_do_not_share_issues(tmp_path):
+    client = fake_client(etag='"v1"')
+
+    IssueResponseCache(path=tmp_path, server='https://one.example.com').fetch(
+        client,
+        'PROJ-1',
+    )
+    other_cache = IssueResponseCache(
+        path=tmp_path,
+        server='https://two.example.com',
+    )
+
+    assert other_cache.read('PROJ-1') is None
@@ -0,0 +1,43 @@
+from jira.client import ResultList
+
+from jirajumper.client import iterate_issues
+
+
+class FakeJira:
+    """Serves search results in pages of at most 3 issues."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.requests = []
+
+    def search_issues(self, jql, startAt, maxResults, fields):
+        self.requests.append((startAt, maxResults))
+        page_end = min(startAt + min(maxResults, 3), self.total)
+        return ResultList(
+            range(startAt, page_end),
+            _startAt=startAt,
+            _maxResults=maxResults,
+            _total=self.total,
+        )
+
+
+def test_all_pages():
+    client = FakeJira(total=7)
+
+    assert list(iterate_issues(client, jql='')) == list(range(7))
+    assert [start for start, _size in client.requests] == [0, 3, 6]
+
+
+def test_limit():
+    client = FakeJira(total=100)
+
+    assert list(iterate_issues(client, jql='', limit=4)) == list(range(4))
+    assert client.requests == [(0, 4), (3, 1)]
+
+
+def test_lazy():
+    client = FakeJira(total=100)
+    issues = iterate_issues(client, jql='')
+
+    next(issues)
+    assert len(client.requests) == 1
@@ -0,0 +1,38 @@
+import subprocess  # noqa: S404
+import sys
+
+from jirajumper.cli import LAZY_COMMANDS
+
+LOAD_JUMP = """
+import sys
+
+import click
+from typer.main import get_command
+
+from jirajumper.cli import app
+
+group = get_command(app)
+assert 'graph' in group.list_commands(click.Context(group))
+
+group.get_command(click.Context(group), 'jump')
+print(' '.join(sorted(sys.modules)))
+"""
+
+
+def test_commands_are_imported_on_dispatch():
+    imported_modules = subprocess.run(  # noqa: S603
+        [sys.executable, '-c', LOAD_JUMP],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    assert 'jirajumper.commands.select' in imported_modules
+    assert 'jirajumper.commands.graph' not in imported_modules
+    assert 'graphviz' not in imported_modules
+    assert 'rich.traceback' not in imported_modules
+
+
+def test_lazy_commands_resolve():
+    for name, lazy_command in LAZY_COMMANDS.items():
+        assert lazy_command.load(name).name == name
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from jirajumper.cache.cache import LinkTypesCache, ResolvedLinkType
+
+
+def test_link_types_by_slug():
+    link_types = LinkTypesCache.parse_obj({
+        'server': 'https://jira.example.com',
+        'retrieved_at': datetime.now(tz=timezone.utc),
+        'link_types': [
+            {'name': 'Blocks', 'inward': 'is blocked by', 'outward': 'blocks'},
+            {
+                'name': 'Relates',
+                'inward': 'relates to',
+                'outward': 'relates to',
+            },
+        ],
+    })
+
+    assert link_types.by_slug == {
+        'blocks': ResolvedLinkType('Blocks', 'blocks', is_inward=False),
+        'is-blocked-by': ResolvedLinkType(
+            'Blocks', 'is blocked by', is_inward=True,
+        ),
+        'relates-to': ResolvedLinkType(
+            'Relates', 'relates to', is_inward=False,
+        ),
+    }
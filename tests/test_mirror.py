@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+
+from jirajumper.cache.mirror import IssueMirror
+from jirajumper.client import issue_from_raw
+from jirajumper.commands.sync import sync_project
+from jirajumper.fields.defaults import ASSIGNEE, STATUS
+
+RAW_ISSUE = {
+    'key': 'PROJ-1',
+    'id': '10001',
+    'fields': {
+        'summary': 'Do something',
+        'status': {'name': 'In Progress'},
+        'updated': '2021-10-15T10:00:00.000+0000',
+    },
+}
+
+
+def test_store_and_find(tmp_path):
+    mirror = IssueMirror(path=tmp_path / 'issues.sqlite3')
+    assert not mirror.exists()
+
+    assert mirror.store([RAW_ISSUE]) == 1
+    assert mirror.raw_issue('PROJ-1') == RAW_ISSUE
+    assert mirror.raw_issue('PROJ-2') is None
+    assert list(mirror.raw_issues()) == [RAW_ISSUE]
+    assert list(mirror.raw_issues(['PROJ'])) == [RAW_ISSUE]
+    assert not list(mirror.raw_issues(['OTHER']))
+
+
+def test_last_sync(tmp_path):
+    mirror = IssueMirror(path=tmp_path / 'issues.sqlite3')
+    synced_at = datetime(2021, 10, 15, tzinfo=timezone.utc)
+
+    assert mirror.last_sync('PROJ') is None
+
+    mirror.mark_synced('PROJ', synced_at)
+    assert mirror.last_sync('PROJ') == synced_at
+    assert mirror.projects() == ['PROJ']
+
+
+def test_matches():
+    issue = issue_from_raw(RAW_ISSUE, server='https://example.com')
+    status = STATUS.resolve(field_key_by_name={})
+
+    assert status.matches(issue=issue, expression='in progress')
+    assert status.matches(issue=issue, expression='Done, In Progress')
+    assert not status.matches(issue=issue, expression='-In Progress')
+    assert status.matches(issue=issue, expression='-Done')
+
+
+def test_assignee_matches_like_jql():
+    issue = issue_from_raw(
+        {
+            **RAW_ISSUE,
+            'fields': {
+                **RAW_ISSUE['fields'],
+                'assignee': {'name': 'jdoe', 'displayName': 'Jane Doe'},
+            },
+        },
+        server='https://example.com',
+    )
+    assignee = ASSIGNEE.resolve(field_key_by_name={})
+
+    assert assignee.matches(issue=issue, expression='jdoe')
+    assert assignee.matches(issue=issue, expression='Jane Doe')
+    assert not assignee.matches(issue=issue, expression='jsmith')
+
+
+class FakeJira:
+    def __init__(self):
+        self.jqls = []
+
+    def search_issues(self, jql, startAt, maxResults, json_result):
+        self.jqls.append(jql)
+        return {'issues': [], 'total': 0}
+
+
+def test_sync_since_relative_date(tmp_path):
+    mirror = IssueMirror(path=tmp_path / 'issues.sqlite3')
+    jira = FakeJira()
+
+    sync_project(jira, mirror, 'PROJ')
+    sync_project(jira, mirror, 'PROJ')
+
+    assert jira.jqls == [
+        'project = "PROJ" ORDER BY updated ASC',
+        'project = "PROJ" AND updated >= "-6m" ORDER BY updated ASC',
+    ]
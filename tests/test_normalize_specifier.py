@@ -0,0 +1,54 @@
+from jira import Issue, JIRA
+
+from jirajumper.commands.select import normalize_issue_specifier
+
+
+def make_issue(raw):
+    return Issue(
+        options={**JIRA.DEFAULT_OPTIONS, 'server': 'https://jira.example.com'},
+        session=None,
+        raw=raw,
+    )
+
+
+class OfflineJira:
+    def issue(self, key):
+        raise AssertionError(f'{key} must not be downloaded.')
+
+
+class OnlineJira:
+    def __init__(self, issue):
+        self.downloaded_issue = issue
+
+    def issue(self, key):
+        assert key == self.downloaded_issue.key
+        return self.downloaded_issue
+
+
+def test_next_downloads_current_issue():
+    blocked_issue = {
+        'key': 'PROJ-2',
+        'fields': {'status': {'statusCategory': {'name': 'To Do'}}},
+    }
+    current_issue = make_issue({
+        'key': 'PROJ-1',
+        'fields': {
+            'issuelinks': [
+                {'type': {'name': 'Blocks'}, 'outwardIssue': blocked_issue},
+            ],
+        },
+    })
+
+    assert normalize_issue_specifier(
+        client=OnlineJira(current_issue),
+        specifier='next',
+        current_issue_key='PROJ-1',
+    ) == 'PROJ-2'
+
+
+def test_numeric_specifier():
+    assert normalize_issue_specifier(
+        client=OfflineJira(),
+        specifier='42',
+        current_issue_key='PROJ-1',
+    ) == 'PROJ-42'
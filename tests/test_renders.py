@@ -0,0 +1,32 @@
+import graphviz
+
+from jirajumper.cache.renders import GraphFormat, cached_render
+
+
+def digraph(label: str) -> graphviz.Digraph:
+    roadmap = graphviz.Digraph()
+    roadmap.node('PROJ-1', label)
+    return roadmap
+
+
+def test_render_once(tmp_path, monkeypatch):
+    renders = []
+    monkeypatch.setattr(
+        graphviz.Digraph,
+        'pipe',
+        lambda roadmap, format: renders.append(format) or b'<svg/>',
+    )
+
+    first_path = cached_render(digraph('A'), GraphFormat.SVG, tmp_path)
+    second_path = cached_render(digraph('A'), GraphFormat.SVG, tmp_path)
+    assert first_path == second_path
+    assert first_path.read_bytes() == b'<svg/>'
+    assert renders == ['svg']
+
+    assert cached_render(digraph('B'), GraphFormat.SVG, tmp_path) != first_path
+    assert renders == ['svg', 'svg']
+
+
+def test_dot_source(tmp_path):
+    render_path = cached_render(digraph('A'), GraphFormat.DOT, tmp_path)
+    assert render_path.read_text() == digraph('A').source
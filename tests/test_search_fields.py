@@ -0,0 +1,23 @@
+from jirajumper.commands.list_issues import with_required_fields
+
+
+def test_search_fields(resolved_fields):
+    search_fields = resolved_fields.search_fields(
+        ['status_category', 'epic', 'status'],
+    )
+    assert search_fields == [
+        'customfield_10008',
+        'status',
+    ]
+
+
+def test_with_required_fields():
+    assert with_required_fields(None, ['status', 'summary']) == [
+        'status',
+        'summary',
+    ]
+    assert with_required_fields('labels, status', ['status', 'summary']) == [
+        'status',
+        'summary',
+        'labels',
+    ]
@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from jirajumper.cache.users import (
+    AmbiguousUser,
+    DirectoryUser,
+    UserDirectory,
+    UserNotFound,
+)
+
+DIRECTORY = UserDirectory(
+    server='https://jira.example.com',
+    retrieved_at=datetime.now(tz=timezone.utc),
+    users=[
+        DirectoryUser(
+            user_id='jane',
+            display_name='Jane Doe',
+            email='jane.doe@example.com',
+        ),
+        DirectoryUser(
+            user_id='john',
+            display_name='John Smith',
+            email='john.smith@example.com',
+        ),
+        DirectoryUser(user_id='janet', display_name='Janet Jackson'),
+    ],
+)
+
+
+@pytest.mark.parametrize(('query', 'user_id'), [
+    ('Jane Doe', 'jane'),
+    ('jane', 'jane'),
+    ('JOHN.SMITH@example.com', 'john'),
+    ('smith', 'john'),
+    ('Jhon Smtih', 'john'),
+    ('Janet Jakson', 'janet'),
+])
+def test_find_user(query, user_id):
+    assert DIRECTORY.find(query).user_id == user_id
+
+
+def test_ambiguous_user():
+    with pytest.raises(AmbiguousUser) as error_info:
+        DIRECTORY.find('ja')
+
+    assert {user.user_id for user in error_info.value.users} == {
+        'jane',
+        'janet',
+    }
+
+
+def test_user_not_found():
+    with pytest.raises(UserNotFound):
+        DIRECTORY.find('Alice Wonder')
@@ -0,0 +1,226 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from jira import JIRAError
+
+from jirajumper.cache.workflows import Workflow
+from jirajumper.commands.status import (
+    NoTransitionFound,
+    learn_workflow,
+    transition_group,
+    transition_to_status,
+)
+
+WORKFLOW = {
+    'Open': ['In Progress'],
+    'In Progress': ['Review', 'Open'],
+    'Review': ['Done'],
+    'Done': ['Open'],
+}
+
+
+def raw_transition(destination):
+    return {
+        'id': destination.lower(),
+        'name': f'To {destination}',
+        'to': {'name': destination},
+    }
+
+
+class FakeJira:
+    def __init__(self, status, others=()):
+        self.status = status
+        self.others = {
+            f'OTHER-{number}': other_status
+            for number, other_status in enumerate(others)
+        }
+        self.requests = []
+
+    def search_issues(self, jql, maxResults, fields):
+        return [
+            SimpleNamespace(key=issue_key)
+            for issue_key, other_status in self.others.items()
+            if jql.endswith(f'status = "{other_status}"')
+        ][:maxResults]
+
+    def transitions(self, issue):
+        self.requests.append(f'transitions {issue}')
+        status = self.others.get(issue, self.status)
+        return [raw_transition(status) for status in WORKFLOW[status]]
+
+    def transition_issue(self, issue, transition):
+        self.requests.append(transition)
+        self.status = next(
+            status
+            for status in WORKFLOW[self.status]
+            if status.lower() == transition
+        )
+
+
+def fake_issue(status):
+    return SimpleNamespace(
+        key='PROJ-1',
+        fields=SimpleNamespace(
+            project=SimpleNamespace(key='PROJ'),
+            issuetype=SimpleNamespace(name='Task'),
+            status=SimpleNamespace(name=status),
+        ),
+    )
+
+
+def test_find_path():
+    workflow = Workflow()
+    for status, destinations in WORKFLOW.items():
+        workflow.learn(status, map(raw_transition, destinations))
+
+    path = workflow.find_path('Done', lambda status: status == 'Review')
+
+    assert [transition.destination for transition in path] == [
+        'Open', 'In Progress', 'Review',
+    ]
+    assert workflow.find_path('Open', lambda status: status == 'Open') == []
+    assert workflow.find_path('Open', lambda status: status == 'Nope') is None
+
+
+def test_learn_workflow_from_other_issues():
+    workflow = Workflow()
+    jira = FakeJira(status='Open', others=['In Progress', 'Review'])
+
+    learn_workflow(jira, workflow, fake_issue('Open'), ['done'])
+    reached = transition_to_status(jira, workflow, 'PROJ-1', 'Open', 'done')
+
+    assert reached == 'Done'
+    assert jira.requests == [
+        'transitions PROJ-1',
+        'transitions OTHER-0',
+        'transitions OTHER-1',
+        'in progress',
+        'review',
+        'done',
+    ]
+
+    jira = FakeJira(status='Open')
+    transition_to_status(jira, workflow, 'PROJ-1', 'Open', 'Done')
+
+    assert jira.requests == ['in progress', 'review', 'done']
+
+
+def test_unreachable_status_moves_nothing():
+    workflow = Workflow()
+    jira = FakeJira(status='Open', others=['Review'])
+
+    with pytest.raises(NoTransitionFound):
+        learn_workflow(jira, workflow, fake_issue('Open'), ['Done'])
+
+    with pytest.raises(NoTransitionFound):
+        transition_to_status(jira, workflow, 'PROJ-1', 'Open', 'Done')
+
+    assert jira.status == 'Open'
+    assert 'in progress' not in jira.requests
+
+
+class FakeAsyncJira:
+    def __init__(self, statuses):
+        self.jiras = {
+            issue_key: FakeJira(status)
+            for issue_key, status in statuses.items()
+        }
+
+    async def post(self, path, body):
+        _, issue_key, _ = path.split('/')
+        self.jiras[issue_key].transition_issue(
+            issue_key,
+            body['transition']['id'],
+        )
+
+
+def transition_group_to_review(workflow):
+    jira = FakeAsyncJira({'PROJ-1': 'Open', 'PROJ-2': 'Open'})
+    errors = asyncio.run(
+        transition_group(
+            jira=jira,
+            workflow=workflow,
+            issue_keys=['PROJ-1', 'PROJ-2'],
+            source_status='Open',
+            destination_statuses=['Review'],
+        ),
+    )
+    return jira, errors
+
+
+def test_transition_group():
+    workflow = Workflow()
+    for status, destinations in WORKFLOW.items():
+        workflow.learn(status, map(raw_transition, destinations))
+
+    jira, errors = transition_group_to_review(workflow)
+
+    assert not errors
+    assert jira.jiras['PROJ-1'].requests == ['in progress', 'review']
+    assert jira.jiras['PROJ-2'].requests == ['in progress', 'review']
+
+
+def test_transition_group_with_unknown_workflow():
+    jira, errors = transition_group_to_review(Workflow())
+
+    assert set(errors) == {'PROJ-1', 'PROJ-2'}
+    assert not jira.jiras['PROJ-1'].requests
+    assert not jira.jiras['PROJ-2'].requests
+
+
+def test_transition_group_through_statuses():
+    workflow = Workflow()
+    for status, destinations in WORKFLOW.items():
+        workflow.learn(status, map(raw_transition, destinations))
+    jira = FakeAsyncJira({'PROJ-1': 'Open'})
+
+    errors = asyncio.run(
+        transition_group(
+            jira=jira,
+            workflow=workflow,
+            issue_keys=['PROJ-1'],
+            source_status='Open',
+            destination_statuses=['in progress', 'REVIEW', 'done'],
+        ),
+    )
+
+    assert not errors
+    assert jira.jiras['PROJ-1'].requests == ['in progress', 'review', 'done']
+
+
+class ScreenlessJira(FakeJira):
+    """JIRA which does not accept fields along with transitions."""
+
+    def __init__(self, status):
+        super().__init__(status)
+        self._session = self
+
+    def _get_url(self, path):
+        return path
+
+    def put(self, url, data):
+        self.requests.append(f'PUT {url}')
+
+    def transition_issue(self, issue, transition, fields=None):
+        if fields:
+            raise JIRAError(status_code=400)
+
+        super().transition_issue(issue, transition)
+
+
+def test_transition_with_fields():
+    workflow = Workflow()
+    workflow.learn('Open', [raw_transition('In Progress')])
+    jira = ScreenlessJira(status='Open')
+
+    transition_to_status(
+        jira,
+        workflow,
+        'PROJ-1',
+        'Open',
+        'In Progress',
+        issue_fields={'summary': 'Taken'},
+    )
+
+    assert jira.requests == ['PUT issue/PROJ-1', 'in progress']